@@ -22,9 +22,16 @@ import csv
 import time
 from tqdm import tqdm
 
+try:
+    # Shared XIQ rate budget with agent_xiq and the other scripts (Checkmk site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # API Configuration (use environment variables)
 API_SECRET = os.getenv('XIQ_API_SECRET')
 XIQ_BASE_URL = 'https://api.extremecloudiq.com'
+GOVERNOR = RateGovernor(os.getenv('ADMIN_MAIL')) if RateGovernor else None
 
 # Configure logging
 LOG_FILE = "client_list.log"
@@ -90,7 +97,11 @@ def get_client_list(views, page=1, limit=100, sort=None, dir=None, where=None):
     }
 
     try:
+        if GOVERNOR:
+            GOVERNOR.acquire()
         response = requests.get(f"{XIQ_BASE_URL}/clients/active", headers=headers, params=params)
+        if GOVERNOR:
+            GOVERNOR.feed(response.headers, response.status_code)
         response.raise_for_status()
         response_json = response.json()
         log.info(f"Client list retrieved successfully with parameters: {params}")
@@ -132,7 +143,8 @@ def fetch_all_clients(views, page_size=100, sort=None, dir=None, where=None):
             break
 
         page += 1
-        time.sleep(3)  # Pause for 3 seconds before requesting the next page
+        if not GOVERNOR:
+            time.sleep(3)  # Pause for 3 seconds before requesting the next page
 
     pbar.close()
     log.info(f"Found {len(all_clients)} clients across {page - 1} pages.")
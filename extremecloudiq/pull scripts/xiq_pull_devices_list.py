@@ -24,9 +24,16 @@ import argparse
 import logging
 from tqdm import tqdm  # Import tqdm for progress bar
 
+try:
+    # Shared XIQ rate budget with agent_xiq and the other scripts (Checkmk site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # API Configuration (use environment variables)
 API_SECRET = os.getenv('XIQ_API_SECRET')
 XIQ_BASE_URL = 'https://api.extremecloudiq.com'
+GOVERNOR = RateGovernor(os.getenv('ADMIN_MAIL')) if RateGovernor else None
 
 # Configure logging
 LOG_FILE = "xiq_api.log"  # Log file
@@ -86,7 +93,11 @@ def make_api_request(url, headers, max_retries=1):
     
     for attempt in range(max_retries + 1):
         try:
+            if GOVERNOR:
+                GOVERNOR.acquire()
             response = requests.get(url, headers=headers)
+            if GOVERNOR:
+                GOVERNOR.feed(response.headers, response.status_code)
             
             if response.status_code == 401:  # Unauthorized - token might be expired
                 if attempt < max_retries:
@@ -160,8 +171,9 @@ def get_devices(views, debug):
                 break
 
             page += 1
-            # Pause for 3 seconds before requesting the next page
-            time.sleep(3)
+            # Pause for 3 seconds before requesting the next page (without governor)
+            if not GOVERNOR:
+                time.sleep(3)
 
         except Exception as e:
             log.error(f"Unexpected error: {str(e)}")
@@ -4,8 +4,15 @@ import csv
 import os
 import logging
 
+try:
+    # Shared XIQ rate budget with agent_xiq and the other scripts (Checkmk site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # API Configuration (use environment variables)
 XIQ_BASE_URL = 'https://api.extremecloudiq.com/v2'
+GOVERNOR = RateGovernor(os.getenv('ADMIN_MAIL')) if RateGovernor else None
 
 # Configure logging
 LOG_FILE = "xiq_api.log"
@@ -86,7 +93,11 @@ def assign_device_location(device_id, location_id, x, y, latitude, longitude):
     }
 
     try:
+        if GOVERNOR:
+            GOVERNOR.acquire()
         response = requests.put(url, headers=headers, json=payload)
+        if GOVERNOR:
+            GOVERNOR.feed(response.headers, response.status_code)
         response.raise_for_status()
         log.info(f"Location assigned to device {device_id} successfully.")
     except requests.exceptions.RequestException as e:
@@ -4,8 +4,15 @@ import csv
 import os
 import logging
 
+try:
+    # Shared XIQ rate budget with agent_xiq and the other scripts (Checkmk site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # API Configuration (use environment variables)
 XIQ_BASE_URL = 'https://api.extremecloudiq.com/v2'
+GOVERNOR = RateGovernor(os.getenv('ADMIN_MAIL')) if RateGovernor else None
 
 # Configure logging
 LOG_FILE = "xiq_api.log"  # Log file
@@ -164,7 +171,11 @@ def create_location(name, org_id, building_id, floor_id, city_id):
         }
     }
     try:
+        if GOVERNOR:
+            GOVERNOR.acquire()
         response = requests.post(f"{XIQ_BASE_URL}/locations", headers={"Authorization": f"Bearer {api_token}", "Content-Type": "application/json"}, json=payload)
+        if GOVERNOR:
+            GOVERNOR.feed(response.headers, response.status_code)
         response.raise_for_status()
         print(f"Location '{name}' created successfully.")
     except requests.exceptions.RequestException as e:
@@ -18,9 +18,16 @@ import os
 import logging
 import argparse
 
+try:
+    # Shared XIQ rate budget with agent_xiq and the other scripts (Checkmk site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # API Configuration (use environment variables)
 API_SECRET = os.getenv('XIQ_API_SECRET')
 XIQ_BASE_URL = 'https://api.extremecloudiq.com'
+GOVERNOR = RateGovernor(os.getenv('ADMIN_MAIL')) if RateGovernor else None
 JSON_FILE = "commands.json"
 
 # Configure logging
@@ -82,7 +89,11 @@ def api_command_execute(device_id, commands):
     }
 
     try:
+        if GOVERNOR:
+            GOVERNOR.acquire()
         response = requests.post(f"{XIQ_BASE_URL}/devices/{device_id}/:cli", headers=headers, data=json.dumps(payload))
+        if GOVERNOR:
+            GOVERNOR.feed(response.headers, response.status_code)
         response.raise_for_status()
         response_json = response.json()
         log.info(f"Commands for device ID {device_id} executed successfully: {response_json}")
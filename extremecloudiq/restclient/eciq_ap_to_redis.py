@@ -12,6 +12,12 @@ import redis
 import requests
 from dotenv import load_dotenv
 
+try:
+    # Gemeinsames XIQ-Rate-Budget mit agent_xiq und den Pull/Put-Skripten (Checkmk-Site)
+    from cmk_addons.plugins.xiq.lib.rate_governor import RateGovernor
+except ImportError:
+    RateGovernor = None
+
 # Umgebungsvariablen laden
 load_dotenv()
 XIQ_BASE_URL = os.getenv("XIQ_BASE_URL", "https://api.extremecloudiq.com")
@@ -19,8 +25,11 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_AP_DB = int(os.getenv("REDIS_AP_DB", 3))  # DB 3 für APs
 REDIS_LOCATIONS_DB = int(os.getenv("REDIS_LOCATIONS_DB", 1))
+REDIS_CHUNK_SIZE = int(os.getenv("REDIS_CHUNK_SIZE", 1000))  # APs pro Pipeline-Batch
+REDIS_TRANSACTION = os.getenv("REDIS_TRANSACTION", "0").lower() in ("1", "true", "yes")  # MULTI/EXEC je Batch
 PAGE_SIZE = int(os.getenv("PAGE_SIZE", 100))
 API_SECRET = None  # Global für den API-Token
+GOVERNOR = RateGovernor(os.getenv("XIQ_USERNAME")) if RateGovernor else None
 
 log = logging.getLogger(__name__)
 
@@ -127,7 +136,7 @@ def check_rate_limits(base_url: str, api_token: str) -> Optional[Dict[str, Any]]
     headers = {"Authorization": f"Bearer {api_token}"}
     try:
         log.info("Prüfe API-Rate-Limits...")
-        response = requests.get(url, headers=headers)
+        response = _governed_get(url, headers)
         if response.status_code == 429:
             retry_after = response.headers.get("Retry-After", "unbekannt")
             log.warning(f"Rate-Limit überschritten! Warte {retry_after} Sekunden.")
@@ -152,6 +161,15 @@ def check_rate_limits(base_url: str, api_token: str) -> Optional[Dict[str, Any]]
         log.error(f"Fehler beim Abfragen der Rate-Limits: {e}")
         return None
 
+# --- GET innerhalb des gemeinsamen Rate-Budgets ---
+def _governed_get(url: str, headers: dict, params: dict = None) -> requests.Response:
+    if GOVERNOR:
+        GOVERNOR.acquire()
+    response = requests.get(url, headers=headers, params=params)
+    if GOVERNOR:
+        GOVERNOR.feed(response.headers, response.status_code)
+    return response
+
 # --- Hilfsfunktion für API-GET mit Rate-Limit-Handling ---
 def api_get_with_rate_limit(url: str, headers: dict, params: dict = None) -> Optional[requests.Response]:
     """
@@ -159,13 +177,14 @@ def api_get_with_rate_limit(url: str, headers: dict, params: dict = None) -> Opt
     Gibt die Response zurück oder None bei Fehler.
     """
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = _governed_get(url, headers, params)
         if response.status_code == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
             log.warning(f"429 Too Many Requests – Warte {retry_after} Sekunden...")
-            time.sleep(retry_after)
-            # Einmaliger Retry
-            response = requests.get(url, headers=headers, params=params)
+            if not GOVERNOR:
+                time.sleep(retry_after)
+            # Einmaliger Retry (mit Governor wartet acquire() bis zum Reset)
+            response = _governed_get(url, headers, params)
         response.raise_for_status()
         # Logge Rate-Limits
         limit = response.headers.get("RateLimit-Limit")
@@ -208,7 +227,8 @@ def get_device_list_paginated(base_url: str, api_token: str) -> Optional[List[Di
             log.info("Reached the last page of devices.")
             break
         page += 1
-        time.sleep(1)  # Höfliche Pause
+        if not GOVERNOR:
+            time.sleep(1)  # Höfliche Pause (ohne Governor)
     log.info(f"Successfully retrieved {len(all_devices)} APs.")
     return all_devices
 
@@ -272,11 +292,17 @@ def get_ssids_for_multiple_devices(base_url: str, api_token: str, device_ids: Li
                         })
                         seen_ssids.add(ssid_name)
             ssids_by_device[device_id] = ssids
-        time.sleep(1)
+        if not GOVERNOR:
+            time.sleep(1)
     return ssids_by_device
 
-def store_ap_data_in_redis(ap_list: List[Dict[str, Any]], api_token: str):
-    """Speichert AP-Daten als Redis-Hash in DB 3 mit id als Schlüssel."""
+def store_ap_data_in_redis(ap_list: List[Dict[str, Any]], api_token: str,
+                           chunk_size: int = REDIS_CHUNK_SIZE, transaction: bool = REDIS_TRANSACTION):
+    """
+    Speichert AP-Daten als Redis-Hash in DB 3 mit id als Schlüssel.
+    Die Schreibzugriffe laufen gebündelt über eine Pipeline (ein Round Trip je
+    chunk_size APs, optional als MULTI/EXEC-Transaktion); geloggt wird je Batch.
+    """
     try:
         r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_AP_DB, decode_responses=True)
         device_ids = [str(ap.get('id', '')) for ap in ap_list if ap.get('id')]
@@ -284,6 +310,23 @@ def store_ap_data_in_redis(ap_list: List[Dict[str, Any]], api_token: str):
             log.warning("Keine Geräte-IDs gefunden. Keine Daten werden in Redis gespeichert.")
             return
         ssids_by_device = get_ssids_for_multiple_devices(XIQ_BASE_URL, api_token, device_ids)
+        chunk_size = max(1, chunk_size)
+        pipe = r.pipeline(transaction=transaction)
+        queued = stored = batches = 0
+        started = time.monotonic()
+
+        def _flush():
+            nonlocal queued, stored, batches
+            if not queued:
+                return
+            batch_started = time.monotonic()
+            pipe.execute()
+            batches += 1
+            stored += queued
+            log.info(f"Redis-Batch {batches}: {queued} APs in {time.monotonic() - batch_started:.3f}s "
+                     f"gespeichert (db={REDIS_AP_DB}, gesamt {stored})")
+            queued = 0
+
         for ap in ap_list:
             device_id = str(ap.get("id", ""))
             if not device_id:
@@ -298,9 +341,14 @@ def store_ap_data_in_redis(ap_list: List[Dict[str, Any]], api_token: str):
                 'locations': json.dumps(ap.get('locations', [])),
                 'ssids': json.dumps(ssids_by_device.get(device_id, []))
             }
-            r.hset(key, mapping=ap_data)
-            log.info(f"AP '{ap_data['hostname']}' in Redis (db={REDIS_AP_DB}) gespeichert: {key}")
+            pipe.hset(key, mapping=ap_data)
             log.debug(f"Stored locations for {key}: {ap_data['locations']}")
+            queued += 1
+            if queued >= chunk_size:
+                _flush()
+        _flush()
+        log.info(f"{stored} APs in {batches} Batch(es) in Redis (db={REDIS_AP_DB}) gespeichert "
+                 f"({time.monotonic() - started:.3f}s, Pipeline{' MULTI/EXEC' if transaction else ''})")
     except redis.exceptions.ConnectionError as e:
         log.error(f"Fehler bei der Verbindung zu Redis (db={REDIS_AP_DB}): {e}")
     except Exception as e:
@@ -618,7 +666,7 @@ def handle_get_devicelist(args, api_token):
             except IOError as e:
                 log.error(f"Fehler beim Schreiben der Geräteliste in '{args.output_file}': {e}")
         if args.store_redis:
-            store_ap_data_in_redis(device_list, api_token)
+            store_ap_data_in_redis(device_list, api_token, args.redis_chunk_size, args.redis_transaction)
         if args.output_csv_file:
             convert_list_to_csv(device_list, args.output_csv_file)
     else:
@@ -754,6 +802,8 @@ def main():
     redis_group.add_argument("--device-function", dest="device_function", help="Filter für Gerätefunktion (z.B. AP).")
     redis_group.add_argument("--exact-match", action="store_true", help="Exakte Übereinstimmung für Filter.")
     redis_group.add_argument("--export-db-csv", help="Exportiert AP-Daten aus Redis DB 3 in eine CSV-Datei.")
+    redis_group.add_argument("--redis-chunk-size", type=int, default=REDIS_CHUNK_SIZE, help="APs pro Redis-Pipeline-Batch bei --store-redis.")
+    redis_group.add_argument("--redis-transaction", action="store_true", default=REDIS_TRANSACTION, help="Jeden Redis-Batch als MULTI/EXEC-Transaktion schreiben.")
     redis_group.add_argument("--export-db-json", help="Exportiert AP-Daten aus Redis DB 3 in eine JSON-Datei.")
 
     output_group = parser.add_argument_group('Ausgabe')
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from typing import Mapping, Any, Iterable
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    Result,
+    Service,
+    State,
+    Metric,
+)
+
+PHASES = ("login", "devices", "radios", "output")
+
+
+def _fmt_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} GiB"
+
+
+def discover_xiq_agent_perf(section: Mapping[str, Any]) -> DiscoveryResult:
+    if section:
+        yield Service()
+
+
+def check_xiq_agent_perf(params: Mapping[str, Any], section: Mapping[str, Any]) -> Iterable[CheckResult]:
+    if not section:
+        yield Result(state=State.UNKNOWN, summary="Keine Agent-Telemetrie vorhanden")
+        return
+
+    runtime = float(section.get("runtime_s") or 0.0)
+    requests = int(section.get("requests") or 0)
+    http_429 = int(section.get("http_429") or 0)
+
+    # Laufzeit vs. Check-Intervall (Standard: WARN 45s, CRIT 55s)
+    warn, crit = params.get("runtime_levels") or (None, None)
+    state = State.OK
+    if crit is not None and runtime >= crit:
+        state = State.CRIT
+    elif warn is not None and runtime >= warn:
+        state = State.WARN
+    levels_txt = f" (warn/crit ab {warn:.0f}s/{crit:.0f}s)" if state != State.OK else ""
+    yield Result(state=state, summary=f"Laufzeit {runtime:.1f}s{levels_txt}")
+
+    yield Result(
+        state=State.OK,
+        summary=f"{requests} Requests, {_fmt_bytes(float(section.get('bytes_received') or 0))} empfangen",
+    )
+    if http_429:
+        yield Result(
+            state=State.WARN,
+            summary=f"{http_429}x Rate-Limit (429), {float(section.get('sleep_429_s') or 0):.1f}s gewartet",
+        )
+
+    phases = section.get("phases") or {}
+    yield Result(
+        state=State.OK,
+        notice="Phasen: " + ", ".join(f"{p} {float(phases.get(p) or 0):.2f}s" for p in PHASES),
+    )
+    for ep, d in sorted((section.get("endpoints") or {}).items()):
+        yield Result(
+            state=State.OK,
+            notice=f"{ep}: {d['requests']} Requests, {_fmt_bytes(d['bytes'])}, {d['seconds']:.2f}s",
+        )
+    yield Result(
+        state=State.OK,
+        notice=(
+            f"Geraete {int(section.get('devices') or 0)}, Wiederholungen {int(section.get('retries') or 0)}, "
+            f"Wartezeit Rate-Governor {float(section.get('governor_wait_s') or 0):.1f}s, "
+            f"Ausgabe {_fmt_bytes(float(section.get('output_bytes') or 0))}"
+        ),
+    )
+
+    yield Metric("xiq_agent_runtime", runtime, levels=(warn, crit) if warn is not None else None)
+    for p in PHASES:
+        yield Metric(f"xiq_agent_phase_{p}", float(phases.get(p) or 0.0))
+    yield Metric("xiq_agent_requests", requests)
+    yield Metric("xiq_agent_retries", int(section.get("retries") or 0))
+    yield Metric("xiq_agent_http_429", http_429)
+    yield Metric("xiq_agent_sleep_429", float(section.get("sleep_429_s") or 0.0))
+    yield Metric("xiq_agent_governor_wait", float(section.get("governor_wait_s") or 0.0))
+    yield Metric("xiq_agent_bytes_received", float(section.get("bytes_received") or 0))
+    yield Metric("xiq_agent_output_bytes", float(section.get("output_bytes") or 0))
+
+
+check_plugin_xiq_agent_perf = CheckPlugin(
+    name="xiq_agent_perf",
+    sections=["xiq_agent_perf"],
+    service_name="XIQ Agent Performance",
+    discovery_function=discover_xiq_agent_perf,
+    check_function=check_xiq_agent_perf,
+    check_default_parameters={"runtime_levels": (45.0, 55.0)},
+)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Mapping, Iterable
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    Result,
+    Service,
+    State,
+    Metric,
+)
+
+
+def discover_xiq_location_summary(section: Mapping[str, Mapping[str, int]]) -> DiscoveryResult:
+    for location in sorted(section):
+        yield Service(item=location)
+
+
+def check_xiq_location_summary(item: str, params: Mapping[str, Any],
+                               section: Mapping[str, Mapping[str, int]]) -> Iterable[CheckResult]:
+    data = section.get(item)
+    if data is None:
+        yield Result(state=State.UNKNOWN, summary="Standort nicht in der Agent-Ausgabe")
+        return
+
+    aps = data["aps"]
+    connected = data["aps_connected"]
+    disconnected = aps - connected
+    c24, c5, c6 = data["clients_24"], data["clients_5"], data["clients_6"]
+    clients = c24 + c5 + c6
+
+    # Default: CRIT only if the whole site is offline; absolute levels optional
+    warn, crit = params.get("disconnected_levels") or (None, None)
+    state = State.OK
+    if aps and disconnected == aps:
+        state = State.CRIT
+    elif crit is not None and disconnected >= crit:
+        state = State.CRIT
+    elif warn is not None and disconnected >= warn:
+        state = State.WARN
+    yield Result(state=state, summary=f"{aps} APs ({connected} verbunden, {disconnected} getrennt)")
+    yield Result(
+        state=State.OK,
+        summary=f"{clients} Clients (2.4GHz {c24}, 5GHz {c5}, 6GHz {c6})",
+    )
+
+    yield Metric("xiq_aps_total", aps)
+    yield Metric("xiq_aps_connected", connected)
+    yield Metric("xiq_aps_disconnected", disconnected)
+    yield Metric("xiq_clients_total", clients)
+    yield Metric("xiq_clients_24", c24)
+    yield Metric("xiq_clients_5", c5)
+    yield Metric("xiq_clients_6", c6)
+
+
+check_plugin_xiq_location_summary = CheckPlugin(
+    name="xiq_location_summary",
+    sections=["extreme_location_summary"],
+    service_name="XIQ Location %s",
+    discovery_function=discover_xiq_location_summary,
+    check_function=check_xiq_location_summary,
+    check_default_parameters={"disconnected_levels": (None, None)},
+)
@@ -20,18 +20,14 @@ from cmk.agent_based.v2 import (
 # - "mac_address" oder "remote_mac"
 # - "port_description"
 # Wichtig: Die Keys muessen zum Parser in sections.py passen!
+# Der Parser liefert eine NeighborTable: zusaetzlich by_host (Zeilen je Hostname)
+# und refs (APs, deren Nachbarn nur im Piggyback stehen, --h1-neighbors reference).
 
 
 def discover_xiq_ap_neighbors(section) -> DiscoveryResult:
     """Ein Service pro AP (item = hostname) basierend auf der Neighbor-Section."""
-    if not section:
-        return
-    seen: Set[str] = set()
-    for e in section:
-        host = (e.get("hostname") or "").strip()
-        if not host or host in seen:
-            continue
-        seen.add(host)
+    hosts: Set[str] = set(getattr(section, "by_host", {})) | set(getattr(section, "refs", {}))
+    for host in sorted(h for h in hosts if h):
         yield Service(item=host)
 
 
@@ -53,12 +49,21 @@ def check_xiq_ap_neighbors(
 ) -> Iterable[CheckResult]:
     """Kurz-Summary + Long-Details. Niemals nur details ohne summary!"""
     # Keine Daten vorhanden
-    if not section:
+    if not section and not getattr(section, "refs", None):
         yield Result(state=State.OK, summary=f"{item}: keine Nachbarn gemeldet")
         return
 
-    # Nur Zeilen fuer dieses Item (Hostname)
-    rows = [e for e in section if ((e.get("hostname") or "").strip() == item)]
+    # Nur Zeilen fuer dieses Item (Hostname), vom Parser vorsortiert
+    rows = list(section.by_host.get(item) or [])
+    ref = section.refs.get(item)
+    if not rows and ref:
+        # Nachbarn nur im Piggyback des APs (agent_xiq --h1-neighbors reference)
+        yield Result(
+            state=State.OK,
+            summary=f"LLDP/CDP: {ref['count']} Nachbar(e), erster: {ref['first'] or '-'}",
+        )
+        yield Result(state=State.OK, notice=f"Details im Service XIQ Status auf dem Host {item}")
+        return
     if not rows:
         yield Result(state=State.OK, summary=f"{item}: keine Nachbarn gefunden")
         return
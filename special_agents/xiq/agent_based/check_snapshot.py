@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import time
+from typing import Mapping, Any, Iterable
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    Result,
+    Service,
+    State,
+    Metric,
+    render,
+)
+
+
+def discover_xiq_snapshot(section: Mapping[str, Any]) -> DiscoveryResult:
+    if section:
+        yield Service()
+
+
+def check_xiq_snapshot(params: Mapping[str, Any], section: Mapping[str, Any]) -> Iterable[CheckResult]:
+    if section.get("state") != "OK":
+        yield Result(
+            state=State.CRIT,
+            summary="Kein Collector-Snapshot (laeuft agent_xiq --collector?)",
+        )
+        if section.get("last_error"):
+            yield Result(state=State.OK, notice=f"Letzter Fehler: {section['last_error']}")
+        return
+
+    age = float(section.get("age_s") or 0.0)
+    warn, crit = params.get("max_age") or (None, None)
+    state = State.OK
+    if crit is not None and age >= crit:
+        state = State.CRIT
+    elif warn is not None and age >= warn:
+        state = State.WARN
+    levels_txt = (
+        f" (warn/crit ab {render.timespan(warn)}/{render.timespan(crit)})" if state != State.OK else ""
+    )
+    yield Result(state=state, summary=f"Snapshot-Alter {render.timespan(age)}{levels_txt}")
+
+    # Letzter Collector-Lauf fehlgeschlagen: Snapshot stammt aus einem frueheren Lauf
+    last_attempt = section.get("last_attempt")
+    last_success = section.get("last_success")
+    if section.get("last_error") and last_attempt and (not last_success or last_attempt > last_success):
+        yield Result(
+            state=State.WARN,
+            summary=f"Letzter Collector-Lauf fehlgeschlagen: {section['last_error']}",
+        )
+
+    events = int(section.get("events") or 0)
+    if events:
+        yield Result(
+            state=State.OK,
+            summary=f"{events} Geraete-Events angewendet (Webhook)",
+        )
+        if section.get("last_event"):
+            yield Result(state=State.OK, notice=f"Letztes Event: {render.datetime(section['last_event'])}")
+
+    created = section.get("created")
+    if created:
+        yield Result(state=State.OK, notice=f"Erstellt: {render.datetime(created)}")
+    if section.get("interval_s"):
+        yield Result(state=State.OK, notice=f"Collector-Intervall: {render.timespan(section['interval_s'])}")
+    if section.get("runtime_s") is not None:
+        yield Result(state=State.OK, notice=f"Laufzeit letzter Collector-Lauf: {section['runtime_s']:.1f}s")
+    if last_attempt:
+        yield Result(
+            state=State.OK,
+            notice=f"Letzter Versuch vor {render.timespan(max(0.0, time.time() - last_attempt))}",
+        )
+
+    yield Metric("xiq_snapshot_age", age, levels=(warn, crit) if warn is not None else None)
+
+
+check_plugin_xiq_snapshot = CheckPlugin(
+    name="xiq_snapshot",
+    sections=["xiq_snapshot"],
+    service_name="XIQ Collector Snapshot",
+    discovery_function=discover_xiq_snapshot,
+    check_function=check_xiq_snapshot,
+    check_default_parameters={"max_age": (600.0, 1800.0)},
+)
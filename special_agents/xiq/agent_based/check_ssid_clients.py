@@ -13,9 +13,6 @@ from cmk.agent_based.v2 import (
     Metric,
 )
 
-from cmk_addons.plugins.xiq.agent_based.common import format_mac
-
-
 # -----------------------------------------------------------------------------
 # DISCOVERY
 # -----------------------------------------------------------------------------
@@ -28,22 +25,11 @@ def discover_xiq_ssids(
     if not section_xiq_radio_information:
         return
 
-    ssids: set[str] = set()
-
-    ssid_freq_map = section_xiq_radio_information.get("_ssid_freq") or {}
-    ssids.update(ssid_freq_map.keys())
-
-    if not ssids:
-        radios = (
-            section_xiq_radio_information.get("_radios")
-            or section_xiq_radio_information.get("radios")
-            or []
-        )
-        for r in radios:
-            for wlan in r.get("wlans", []):
-                s = (wlan.get("ssid") or "").strip()
-                if s:
-                    ssids.add(s)
+    # configured WLANs of the radios plus SSIDs with clients (_ssid_freq from the
+    # agent); _ssid_freq alone would only find SSIDs that have clients right now
+    ssids = set(section_xiq_radio_information.get("_ssid_freq") or {})
+    for r in section_xiq_radio_information.get("_radios") or []:
+        ssids.update(r.get("ssid_list") or [])
 
     for ssid in sorted(ssids):
         yield Service(item=ssid)
@@ -66,43 +52,15 @@ def check_xiq_ssid_clients(
     ap_name = section_extreme_ap_status.get("ap_name", "") if section_extreme_ap_status else ""
     ssid = item
 
-    radios = (
-        section_xiq_radio_information.get("_radios")
-        or section_xiq_radio_information.get("radios")
-        or []
-    )
-
-    ssid_freq_map = section_xiq_radio_information.get("_ssid_freq") or {}
-
+    # Clients/BSSIDs per band, precomputed by parse_xiq_radio_information
+    entry = (section_xiq_radio_information.get("_ssid_index") or {}).get(ssid) or {}
     counts = {"2.4GHz": 0, "5GHz": 0, "6GHz": 0}
-    notices: List[str] = []
-
-    for r in radios:
-        freq = r.get("frequency", "")
-        if freq not in counts:
-            continue
-
-        wlans = r.get("wlans", [])
-        clients_total = int(r.get("client_count") or 0)
-
-        if ssid in ssid_freq_map:
-            try:
-                per_freq = int(ssid_freq_map[ssid].get(freq, 0))
-                if per_freq > 0:
-                    counts[freq] += per_freq
-                    continue
-            except Exception:
-                pass
-
-        ssids_on_radio = [w.get("ssid") for w in wlans]
-        if ssids_on_radio == [ssid]:
-            counts[freq] += clients_total
-        else:
-            if clients_total > 0 and ssid in ssids_on_radio:
-                notices.append(
-                    f"{freq}: {clients_total} Clients auf Radio '{r.get('radio_name')}' "
-                    f"mit {len(ssids_on_radio)} SSIDs – Verteilung unbekannt"
-                )
+    counts.update(entry.get("clients") or {})
+    notices: List[str] = [
+        f"{freq}: {clients_total} Clients auf Radio '{radio_name}' "
+        f"mit {n_ssids} SSIDs – Verteilung unbekannt"
+        for freq, clients_total, radio_name, n_ssids in entry.get("unassigned") or []
+    ]
 
     total = sum(counts.values())
 
@@ -130,18 +88,8 @@ def check_xiq_ssid_clients(
     # BSSID & Policy
     # -------------------------------------------------------------------------
     bssids = {"2.4GHz": "", "5GHz": "", "6GHz": ""}
-    policy = ""
-
-    for r in radios:
-        freq = r.get("frequency", "")
-        if freq not in bssids:
-            continue
-
-        for wlan in r.get("wlans", []):
-            if wlan.get("ssid") == ssid:
-                bssids[freq] = format_mac(wlan.get("bssid", ""))
-                if not policy:
-                    policy = wlan.get("policy", "")
+    bssids.update(entry.get("bssids") or {})
+    policy = entry.get("policy") or ""
 
     # -------------------------------------------------------------------------
     # Details-Block (Markdown)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import time
 from typing import Any, List, Optional, Tuple, Mapping, Iterable
 from cmk.agent_based.v2 import (
     CheckPlugin,
@@ -102,8 +103,11 @@ def check_xiq_summary(section_extreme_summary,
 
     inv_ap_conn, inv_ap_disc = _count_ap_connected(section_extreme_device_inventory)
 
-    # Kurz-Summary
+    # Kurz-Summary (bei Sharding nur der Anteil dieses Hosts)
     short = f"{aps} APs, {tcl} Clients"
+    shard = section_extreme_summary.get("shard")
+    if shard:
+        short += f" (Shard {shard}, Teilsumme)"
     yield Result(state=State.OK, summary=short)
 
     # Perfdata
@@ -143,3 +147,75 @@ check_plugin_xiq_summary = CheckPlugin(
     discovery_function=discover_xiq_summary,
     check_function=check_xiq_summary,
 )
+
+
+# ---------------------------------------------------------------------------
+# Kombinierte Summary ueber alle Shards (agent_xiq --shard i/n)
+# ---------------------------------------------------------------------------
+def discover_xiq_summary_combined(section: Mapping[int, Mapping[str, Any]]) -> DiscoveryResult:
+    if section:
+        yield Service()
+
+
+def check_xiq_summary_combined(params: Mapping[str, Any],
+                               section: Mapping[int, Mapping[str, Any]]) -> Iterable[CheckResult]:
+    if not section:
+        yield Result(state=State.UNKNOWN, summary="Keine Shard-Summen vorhanden")
+        return
+
+    now = time.time()
+    max_age = int(params.get("max_age", 900))
+    shards = max(_to_int(e.get("shards"), 0) for e in section.values())
+
+    current = {i: e for i, e in section.items() if now - _to_int(e.get("timestamp"), 0) <= max_age}
+    stale = sorted(set(section) - set(current))
+    missing = sorted(set(range(1, shards + 1)) - set(section))
+
+    # stale shards (dead collector) are reported, but not added up
+    totals = {
+        key: sum(_to_int(e.get(key), 0) for e in current.values())
+        for key in ("access_points", "total_clients", "clients_24", "clients_5", "clients_6", "devices")
+    }
+    aps, tcl = totals["access_points"], totals["total_clients"]
+
+    yield Result(state=State.OK, summary=f"{aps} APs, {tcl} Clients")
+    state = State.OK if not missing and not stale else State.WARN
+    yield Result(state=state, summary=f"Shards {len(current)}/{shards} aktuell")
+    if missing:
+        yield Result(state=State.WARN, summary="fehlend: " + ", ".join(f"{i}/{shards}" for i in missing))
+    if stale:
+        yield Result(
+            state=State.WARN,
+            summary="veraltet (nicht mitgezaehlt): " + ", ".join(
+                f"{i}/{shards} ({_to_int(section[i].get('access_points'), 0)} APs)" for i in stale
+            ),
+        )
+
+    yield Metric("xiq_aps_total", aps)
+    yield Metric("xiq_clients_total", tcl)
+    yield Metric("xiq_clients_24", totals["clients_24"])
+    yield Metric("xiq_clients_5", totals["clients_5"])
+    yield Metric("xiq_clients_6", totals["clients_6"])
+
+    lines = [
+        f"Shard {i}/{e.get('shards')} ({e.get('shard_by')}): {e.get('access_points')} APs, "
+        f"{e.get('total_clients')} Clients, {e.get('devices')} Geraete, "
+        f"Alter {int(now - _to_int(e.get('timestamp'), 0))}s"
+        f"{'' if i in current else ' - veraltet, nicht mitgezaehlt'}"
+        for i, e in sorted(section.items())
+    ]
+    lines.append(f"Geraete gesamt in XIQ: {totals['devices']}")
+    yield Result(
+        state=State.OK,
+        notice="XIQ Shards: Details siehe Langtext",
+        details="\n".join(lines),
+    )
+
+check_plugin_xiq_summary_combined = CheckPlugin(
+    name="xiq_summary_combined",
+    sections=["extreme_summary_shards"],
+    service_name="XIQ Summary Combined",
+    discovery_function=discover_xiq_summary_combined,
+    check_function=check_xiq_summary_combined,
+    check_default_parameters={"max_age": 900},
+)
@@ -1,15 +1,31 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import Any, List, Mapping, Optional
 from cmk.agent_based.v2 import (
+    Attributes,
     InventoryPlugin,
     TableRow,
 )
 
 from .common import extract_location_leaf, norm_connected
 
-def inventory_xiq_devices(section: List[List[str]]):
-    for row in section:
+def inventory_xiq_devices(section_extreme_device_inventory: Optional[List[List[str]]],
+                          section_extreme_inventory_state: Optional[Mapping[str, Any]]):
+    # agent_xiq --inventory-delta: "unchanged" runs carry no table, Checkmk then
+    # hands in the persisted table of the last full run
+    state = section_extreme_inventory_state
+    if state:
+        yield Attributes(
+            path=["extreme"],
+            inventory_attributes={"devices": state.get("devices", 0)},
+            status_attributes={
+                "inventory_mode": state.get("mode", ""),
+                "inventory_last_full": state.get("last_full", 0),
+                "inventory_table": "present" if section_extreme_device_inventory else "missing",
+            },
+        )
+
+    for row in section_extreme_device_inventory or []:
         # Robustes Auslesen nach Index (Sektionen liefern 11 Spalten  Index 10 ist connected)
         dev_id      = row[0] if len(row) > 0 else ""
         hostname    = row[1] if len(row) > 1 else ""
@@ -55,6 +71,6 @@ def inventory_xiq_devices(section: List[List[str]]):
 
 inventory_plugin_xiq_devices = InventoryPlugin(
     name="xiq_inventory_devices",
-    sections=["extreme_device_inventory"],
+    sections=["extreme_device_inventory", "extreme_inventory_state"],
     inventory_function=inventory_xiq_devices,
 )
@@ -5,8 +5,13 @@ from cmk.agent_based.v2 import (
     TableRow,
 )
 
-def inventory_xiq_neighbors(section):
-    for e in section:
+def inventory_xiq_neighbors(section_extreme_device_neighbors, section_extreme_ap_neighbors):
+    # H1: table of all devices. AP hosts: their own rows from the piggyback, but
+    # only if they are not in the H1 table (xiq_ap_neighbors, --h1-neighbors reference/non-ap)
+    rows = list(section_extreme_device_neighbors or [])
+    if getattr(section_extreme_ap_neighbors, "h1_omitted", False):
+        rows += section_extreme_ap_neighbors
+    for e in rows:
         key = f"{e.get('device_id','')}_{e.get('local_port','')}"
         yield TableRow(
             path=["networking", "lldp_infos"],
@@ -26,6 +31,6 @@ def inventory_xiq_neighbors(section):
 
 inventory_plugin_xiq_neighbors = InventoryPlugin(
     name="xiq_inventory_neighbors",
-    sections=["extreme_device_neighbors"],
+    sections=["extreme_device_neighbors", "extreme_ap_neighbors"],
     inventory_function=inventory_xiq_neighbors,
 )
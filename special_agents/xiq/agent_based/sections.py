@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from typing import Mapping, Any, Optional, List, Dict
-import json
 import time
 
 from cmk.agent_based.v2 import (
@@ -9,7 +8,8 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
-from .common import format_mac, _clean_text
+from .common import format_mac, _clean_text, _to_int_safe
+from ..lib.jsoncodec import loads as json_loads
 
 
 # ---------------------------------------------------------------------------
@@ -61,6 +61,51 @@ def parse_xiq_summary(table: StringTable) -> Optional[Mapping[str, Any]]:
     return {line[0]: line[1] for line in table if len(line) >= 2}
 
 
+# ---------------------------------------------------------------------------
+# Summary shards (partial summaries of sharded agent runs)
+# ---------------------------------------------------------------------------
+_SHARD_COUNTERS = ("access_points", "total_clients", "clients_24", "clients_5", "clients_6", "devices")
+
+
+def parse_xiq_summary_shards(table: StringTable) -> Optional[Mapping[int, Mapping[str, Any]]]:
+    """shard|shards|shard_by|timestamp|<counters> -> {shard: {...}}, newest row per shard wins."""
+    res: Dict[int, Dict[str, Any]] = {}
+    for line in table:
+        if len(line) < 4 + len(_SHARD_COUNTERS):
+            continue
+        try:
+            shard, shards, ts = int(line[0]), int(line[1]), int(line[3])
+            counters = [int(v) for v in line[4:4 + len(_SHARD_COUNTERS)]]
+        except ValueError:
+            continue
+        if shard in res and res[shard]["timestamp"] >= ts:
+            continue
+        entry: Dict[str, Any] = {"shards": shards, "shard_by": line[2], "timestamp": ts}
+        entry.update(zip(_SHARD_COUNTERS, counters))
+        res[shard] = entry
+    return res or None
+
+
+# ---------------------------------------------------------------------------
+# Location summary (per LOC code, computed by the agent)
+# ---------------------------------------------------------------------------
+_LOCATION_COUNTERS = ("aps", "aps_connected", "clients_24", "clients_5", "clients_6")
+
+
+def parse_xiq_location_summary(table: StringTable) -> Optional[Mapping[str, Mapping[str, int]]]:
+    """location|aps|aps_connected|clients_24|clients_5|clients_6 -> {location: {...}}"""
+    res: Dict[str, Dict[str, int]] = {}
+    for line in table:
+        if len(line) < 1 + len(_LOCATION_COUNTERS) or not line[0]:
+            continue
+        try:
+            counters = [int(v) for v in line[1:1 + len(_LOCATION_COUNTERS)]]
+        except ValueError:
+            continue
+        res[line[0]] = dict(zip(_LOCATION_COUNTERS, counters))
+    return res or None
+
+
 # ---------------------------------------------------------------------------
 # AP STATUS
 # ---------------------------------------------------------------------------
@@ -216,12 +261,39 @@ def parse_xiq_device_inventory(table: StringTable) -> List[List[str]]:
 # ---------------------------------------------------------------------------
 # NEIGHBORS (LLDP/CDP)  fully cleaned
 # ---------------------------------------------------------------------------
-def parse_xiq_device_neighbors(table: StringTable) -> List[Mapping[str, str]]:
-    result: List[Mapping[str, str]] = []
+class NeighborTable(List[Mapping[str, str]]):
+    """
+    Neighbor rows (a plain list for existing consumers) plus, parsed once:
+      by_host: hostname -> its rows (no per-item filtering in the checks)
+      refs:    hostname -> {"device_id", "host_ip", "count", "first"} for APs
+               whose rows are only in their piggyback data (agent_xiq
+               --h1-neighbors reference)
+      h1_omitted: AP piggyback rows that are not in the H1 table
+                  (xiq_ap_neighbors, --h1-neighbors reference|non-ap)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_host: Dict[str, List[Mapping[str, str]]] = {}
+        self.refs: Dict[str, Mapping[str, Any]] = {}
+        self.h1_omitted = False
+
+
+def parse_xiq_device_neighbors(table: StringTable) -> NeighborTable:
+    result = NeighborTable()
     for row in table:
+        if len(row) == 5:
+            # reference row: device_id|hostname|host_ip|count|first neighbor
+            result.refs[_clean_text(row[1])] = {
+                "device_id": _clean_text(row[0]),
+                "host_ip":   _clean_text(row[2]),
+                "count":     _to_int_safe(row[3]),
+                "first":     _clean_text(row[4]),
+            }
+            continue
         if len(row) < 9:
             continue
-        result.append({
+        entry = {
             "device_id":        _clean_text(row[0]),
             "hostname":         _clean_text(row[1]),
             "host_ip":          _clean_text(row[2]),
@@ -231,13 +303,73 @@ def parse_xiq_device_neighbors(table: StringTable) -> List[Mapping[str, str]]:
             "port_description": _clean_text(row[6]),
             "mac_address":      format_mac(_clean_text(row[7])),
             "remote_device":    _clean_text(row[8]),
-        })
+        }
+        result.append(entry)
+        result.by_host.setdefault(entry["hostname"].strip(), []).append(entry)
+    return result
+
+
+def parse_xiq_ap_neighbors_h1_omitted(table: StringTable) -> NeighborTable:
+    """<<<xiq_ap_neighbors>>>: extreme_ap_neighbors whose rows are not in the H1 table."""
+    result = parse_xiq_device_neighbors(table)
+    result.h1_omitted = True
     return result
 
 
 # ---------------------------------------------------------------------------
 # RADIO INFORMATION (JSON)  includes policies
 # ---------------------------------------------------------------------------
+def _build_ssid_index(radios: List[Dict[str, Any]], ssid_freq: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    ssid -> {"clients": {band: n}, "bssids": {band: mac}, "policy": str,
+    "unassigned": [(band, clients, radio_name, ssids_on_radio), ...]}
+    built once per parse, so discovery and check of xiq_ssid_clients are lookups.
+
+    Clients per band: per-SSID counts from _ssid_freq where known; otherwise
+    the radio's client count if the SSID is the only one on the radio. Radios
+    with several SSIDs and no per-SSID counts end up in "unassigned".
+    """
+    index: Dict[str, Any] = {}
+
+    def entry(ssid: str) -> Dict[str, Any]:
+        e = index.get(ssid)
+        if e is None:
+            e = index[ssid] = {
+                "clients": {"2.4GHz": 0, "5GHz": 0, "6GHz": 0},
+                "bssids": {"2.4GHz": "", "5GHz": "", "6GHz": ""},
+                "policy": "",
+                "unassigned": [],
+            }
+        return e
+
+    for r in radios:
+        freq = r["frequency"]
+        ssids_on_radio = [w["ssid"] for w in r["wlans"]]
+        clients_total = r["client_count"]
+
+        for w in r["wlans"]:
+            if w["ssid"]:
+                e = entry(w["ssid"])
+                e["bssids"][freq] = w["bssid"]
+                if not e["policy"]:
+                    e["policy"] = w["policy"]
+
+        for ssid in set(s for s in ssids_on_radio if s) | set(ssid_freq):
+            e = entry(ssid)
+            try:
+                per_freq = int((ssid_freq.get(ssid) or {}).get(freq, 0))
+            except Exception:
+                per_freq = 0
+            if per_freq > 0:
+                e["clients"][freq] += per_freq
+            elif ssids_on_radio == [ssid]:
+                e["clients"][freq] += clients_total
+            elif clients_total > 0 and ssid in ssids_on_radio:
+                e["unassigned"].append((freq, clients_total, r["radio_name"], len(ssids_on_radio)))
+
+    return index
+
+
 def parse_xiq_radio_information(table: StringTable) -> Optional[Mapping[str, Any]]:
     if not table:
         return None
@@ -247,7 +379,7 @@ def parse_xiq_radio_information(table: StringTable) -> Optional[Mapping[str, Any
         return None
 
     try:
-        data = json.loads(raw)
+        data = json_loads(raw)
     except Exception:
         return None
 
@@ -259,7 +391,14 @@ def parse_xiq_radio_information(table: StringTable) -> Optional[Mapping[str, Any
     result["_radios"] = []
     result["_device_id"] = device_id
     result["_hostname"] = hostname
+    # clients per SSID and band as computed by the agent (radio client lists or /clients/active)
     result["_ssid_freq"] = {}
+    for ssid, per_band in (data.get("_ssid_freq") or {}).items():
+        if not isinstance(per_band, dict) or not str(ssid).strip():
+            continue
+        result["_ssid_freq"][str(ssid).strip()] = {
+            band: _to_int_safe(per_band.get(band)) for band in ("2.4GHz", "5GHz", "6GHz")
+        }
 
     # For discovery / aggregation: SSID per band
     freq_map: Dict[str, List[Dict[str, Any]]] = {"2.4GHz": [], "5GHz": [], "6GHz": []}
@@ -330,9 +469,83 @@ def parse_xiq_radio_information(table: StringTable) -> Optional[Mapping[str, Any
         })
 
     result.update(freq_map)
+    result["_ssid_index"] = _build_ssid_index(result["_radios"], result["_ssid_freq"])
     return result
 
 
+# ---------------------------------------------------------------------------
+# SNAPSHOT (collector mode, agent_xiq --from-cache)
+# ---------------------------------------------------------------------------
+def parse_xiq_snapshot(table: StringTable) -> Optional[Mapping[str, Any]]:
+    """
+    <<<xiq_snapshot:sep(124)>>> from 'agent_xiq --from-cache':
+    state|OK, created|<ts>, age_s|<s>, last_attempt|..., last_success|...,
+    runtime_s|..., interval_s|..., last_error|<text>
+    """
+    if not table:
+        return None
+    res: Dict[str, Any] = {}
+    for line in table:
+        if not line:
+            continue
+        key, value = line[0], "|".join(line[1:])
+        if key in ("state", "last_error"):
+            res[key] = value
+            continue
+        try:
+            res[key] = float(value)
+        except ValueError:
+            continue
+    return res if "state" in res else None
+
+
+# ---------------------------------------------------------------------------
+# INVENTORY STATE (agent_xiq --inventory-delta)
+# ---------------------------------------------------------------------------
+def parse_xiq_inventory_state(table: StringTable) -> Optional[Mapping[str, Any]]:
+    """
+    <<<extreme_inventory_state:sep(124)>>> from 'agent_xiq --inventory-delta':
+    mode|full|unchanged, devices|<n>, changed|<n>, last_full|<ts>, resync_s|<s>
+    """
+    res: Dict[str, Any] = {}
+    for line in table:
+        if len(line) < 2:
+            continue
+        res[line[0]] = line[1] if line[0] == "mode" else _to_int_safe(line[1])
+    return res if "mode" in res else None
+
+
+# ---------------------------------------------------------------------------
+# AGENT PERFORMANCE (telemetry of the special agent run)
+# ---------------------------------------------------------------------------
+def parse_xiq_agent_perf(table: StringTable) -> Optional[Mapping[str, Any]]:
+    if not table:
+        return None
+    res: Dict[str, Any] = {"phases": {}, "endpoints": {}}
+
+    def _num(val: str) -> float:
+        try:
+            return float(val)
+        except Exception:
+            return 0.0
+
+    for line in table:
+        if not line:
+            continue
+        key = line[0].strip()
+        if key == "phase" and len(line) >= 3:
+            res["phases"][line[1]] = _num(line[2])
+        elif key == "endpoint" and len(line) >= 5:
+            res["endpoints"][line[1]] = {
+                "requests": int(_num(line[2])),
+                "bytes": int(_num(line[3])),
+                "seconds": _num(line[4]),
+            }
+        elif len(line) >= 2:
+            res[key] = _num(line[1])
+    return res if "runtime_s" in res else None
+
+
 # ---------------------------------------------------------------------------
 # SECTION REGISTRATIONS
 # ---------------------------------------------------------------------------
@@ -380,3 +593,34 @@ agent_section_xiq_ap_neighbors = AgentSection(
     name="extreme_ap_neighbors",
     parse_function=parse_xiq_device_neighbors,
 )
+
+agent_section_xiq_ap_neighbors_h1_omitted = AgentSection(
+    name="xiq_ap_neighbors",
+    parsed_section_name="extreme_ap_neighbors",
+    parse_function=parse_xiq_ap_neighbors_h1_omitted,
+)
+
+agent_section_xiq_snapshot = AgentSection(
+    name="xiq_snapshot",
+    parse_function=parse_xiq_snapshot,
+)
+
+agent_section_xiq_inventory_state = AgentSection(
+    name="extreme_inventory_state",
+    parse_function=parse_xiq_inventory_state,
+)
+
+agent_section_xiq_agent_perf = AgentSection(
+    name="xiq_agent_perf",
+    parse_function=parse_xiq_agent_perf,
+)
+
+agent_section_xiq_location_summary = AgentSection(
+    name="extreme_location_summary",
+    parse_function=parse_xiq_location_summary,
+)
+
+agent_section_xiq_summary_shards = AgentSection(
+    name="extreme_summary_shards",
+    parse_function=parse_xiq_summary_shards,
+)
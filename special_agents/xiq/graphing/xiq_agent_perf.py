@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+XIQ Agent Performance (Checkmk 2.4, Graphing API v1)
+
+Metriken und Graphen fuer die Checks "xiq_agent_perf" (Laufzeit, Phasen,
+API-Requests und Datenmengen des Special Agents) und "xiq_snapshot"
+(Alter des Collector-Snapshots).
+"""
+from cmk.graphing.v1 import graphs, metrics
+
+UNIT_COUNTER = metrics.Unit(metrics.DecimalNotation(""), metrics.AutoPrecision(0))
+UNIT_SECONDS = metrics.Unit(metrics.TimeNotation())
+UNIT_BYTES = metrics.Unit(metrics.IECNotation("B"))
+
+# --------------------------------------------------------------------
+# Laufzeit gesamt und je Phase
+# --------------------------------------------------------------------
+metric_xiq_agent_runtime = metrics.Metric(
+    name="xiq_agent_runtime",
+    title=metrics.Title("Agent Laufzeit"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.BLUE,
+)
+
+metric_xiq_agent_phase_login = metrics.Metric(
+    name="xiq_agent_phase_login",
+    title=metrics.Title("Phase Login"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.YELLOW,
+)
+
+metric_xiq_agent_phase_devices = metrics.Metric(
+    name="xiq_agent_phase_devices",
+    title=metrics.Title("Phase Geraeteabfrage"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.GREEN,
+)
+
+metric_xiq_agent_phase_radios = metrics.Metric(
+    name="xiq_agent_phase_radios",
+    title=metrics.Title("Phase Radio-Informationen"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.ORANGE,
+)
+
+metric_xiq_agent_phase_output = metrics.Metric(
+    name="xiq_agent_phase_output",
+    title=metrics.Title("Phase Ausgabe"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.PURPLE,
+)
+
+metric_xiq_agent_sleep_429 = metrics.Metric(
+    name="xiq_agent_sleep_429",
+    title=metrics.Title("Wartezeit nach 429"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.RED,
+)
+
+metric_xiq_agent_governor_wait = metrics.Metric(
+    name="xiq_agent_governor_wait",
+    title=metrics.Title("Wartezeit Rate-Governor"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.LIGHT_RED,
+)
+
+metric_xiq_snapshot_age = metrics.Metric(
+    name="xiq_snapshot_age",
+    title=metrics.Title("Alter Collector-Snapshot"),
+    unit=UNIT_SECONDS,
+    color=metrics.Color.DARK_CYAN,
+)
+
+# --------------------------------------------------------------------
+# Requests
+# --------------------------------------------------------------------
+metric_xiq_agent_requests = metrics.Metric(
+    name="xiq_agent_requests",
+    title=metrics.Title("API Requests pro Lauf"),
+    unit=UNIT_COUNTER,
+    color=metrics.Color.DARK_BLUE,
+)
+
+metric_xiq_agent_retries = metrics.Metric(
+    name="xiq_agent_retries",
+    title=metrics.Title("Wiederholte Requests"),
+    unit=UNIT_COUNTER,
+    color=metrics.Color.ORANGE,
+)
+
+metric_xiq_agent_http_429 = metrics.Metric(
+    name="xiq_agent_http_429",
+    title=metrics.Title("HTTP 429 Antworten"),
+    unit=UNIT_COUNTER,
+    color=metrics.Color.RED,
+)
+
+# --------------------------------------------------------------------
+# Datenmengen
+# --------------------------------------------------------------------
+metric_xiq_agent_bytes_received = metrics.Metric(
+    name="xiq_agent_bytes_received",
+    title=metrics.Title("Empfangene Daten (API)"),
+    unit=UNIT_BYTES,
+    color=metrics.Color.CYAN,
+)
+
+metric_xiq_agent_output_bytes = metrics.Metric(
+    name="xiq_agent_output_bytes",
+    title=metrics.Title("Agent-Ausgabe"),
+    unit=UNIT_BYTES,
+    color=metrics.Color.BROWN,
+)
+
+# ------------------------------------------------------------
+# Graphen
+# ------------------------------------------------------------
+graph_xiq_agent_phases = graphs.Graph(
+    name="xiq_agent_phases",
+    title=metrics.Title("XIQ Agent: Laufzeit nach Phase"),
+    minimal_range=graphs.MinimalRange(0, 10),
+    compound_lines=[
+        "xiq_agent_phase_login",
+        "xiq_agent_phase_devices",
+        "xiq_agent_phase_radios",
+        "xiq_agent_phase_output",
+    ],
+    simple_lines=["xiq_agent_runtime"],
+)
+
+graph_xiq_agent_waits = graphs.Graph(
+    name="xiq_agent_waits",
+    title=metrics.Title("XIQ Agent: Wartezeiten (Rate-Limit)"),
+    minimal_range=graphs.MinimalRange(0, 1),
+    simple_lines=["xiq_agent_sleep_429", "xiq_agent_governor_wait"],
+)
+
+graph_xiq_agent_requests = graphs.Graph(
+    name="xiq_agent_requests",
+    title=metrics.Title("XIQ Agent: API Requests"),
+    minimal_range=graphs.MinimalRange(0, 10),
+    simple_lines=["xiq_agent_requests", "xiq_agent_retries", "xiq_agent_http_429"],
+)
+
+graph_xiq_agent_bytes = graphs.Graph(
+    name="xiq_agent_bytes",
+    title=metrics.Title("XIQ Agent: Datenmengen"),
+    minimal_range=graphs.MinimalRange(0, 1024),
+    simple_lines=["xiq_agent_bytes_received", "xiq_agent_output_bytes"],
+)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON codec for agent_xiq and the XIQ section parsers.
+
+Uses orjson or ujson when installed, the stdlib json module otherwise:
+
+    from cmk_addons.plugins.xiq.lib.jsoncodec import dumps, loads
+    data = loads(response.content)      # bytes or str
+    line = dumps(payload)               # compact str, non-ASCII kept as is
+
+dumps() always produces compact output (no spaces after "," and ":") and
+keeps non-ASCII characters unescaped, like
+json.dumps(obj, ensure_ascii=False, separators=(",", ":")). Objects the fast
+codec cannot encode (e.g. non-str keys, integers above 64 bit) fall back to
+the stdlib encoder.
+
+XIQ_JSON_BACKEND=json|ujson|orjson forces a backend (troubleshooting).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:
+    ujson = None  # type: ignore[assignment]
+
+
+JsonInput = Union[str, bytes, bytearray]
+
+
+def _std_loads(data: JsonInput) -> Any:
+    return json.loads(data)
+
+
+def _std_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _orjson_loads(data: JsonInput) -> Any:
+    return orjson.loads(data)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    try:
+        return orjson.dumps(obj).decode("utf-8")
+    except TypeError:
+        return _std_dumps(obj)
+
+
+def _ujson_loads(data: JsonInput) -> Any:
+    return ujson.loads(data)
+
+
+def _ujson_dumps(obj: Any) -> str:
+    try:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+    except (TypeError, OverflowError):
+        return _std_dumps(obj)
+
+
+def backends() -> Dict[str, Tuple[Callable[[JsonInput], Any], Callable[[Any], str]]]:
+    """All installed backends as name -> (loads, dumps); stdlib is always present."""
+    found = {"json": (_std_loads, _std_dumps)}
+    if ujson is not None:
+        found["ujson"] = (_ujson_loads, _ujson_dumps)
+    if orjson is not None:
+        found["orjson"] = (_orjson_loads, _orjson_dumps)
+    return found
+
+
+def _select() -> str:
+    available = backends()
+    forced = os.environ.get("XIQ_JSON_BACKEND", "").strip().lower()
+    if forced in available:
+        return forced
+    for name in ("orjson", "ujson"):
+        if name in available:
+            return name
+    return "json"
+
+
+BACKEND = _select()
+loads, dumps = backends()[BACKEND]
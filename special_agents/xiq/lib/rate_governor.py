@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cross-process rate governor for the ExtremeCloud IQ API.
+
+agent_xiq (several hosts in parallel), eciq_ap_to_redis.py and the
+pull/put scripts all spend the same per-account API budget. Instead of
+hard-coded sleeps each tool asks the governor before every request:
+
+    gov = RateGovernor(username)
+    gov.acquire()                       # blocks only if the budget is spent
+    r = session.get(...)
+    gov.feed(r.headers, r.status_code)  # RateLimit-* headers keep it exact
+
+The budget is a token bucket (capacity = RateLimit-Limit, refill =
+limit / window) stored in one small JSON file per account. All access is
+serialized with an exclusive file lock, so every process on the host sees
+the same bucket. The state lives in $OMD_ROOT/tmp (tmpfs on OMD sites).
+
+A 429 blocks all processes of the account until Retry-After / reset.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: process-local locking only
+    fcntl = None  # type: ignore[assignment]
+
+
+DEFAULT_BACKOFF_S = 5.0
+
+
+def _state_dir() -> str:
+    path = os.environ.get("XIQ_GOVERNOR_DIR")
+    if not path:
+        omd_root = os.environ.get("OMD_ROOT")
+        if omd_root:
+            path = os.path.join(omd_root, "tmp", "check_mk", "special_agents", "xiq")
+        else:
+            path = os.path.join("/tmp", "xiq")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _to_int(val: Any) -> Optional[int]:
+    if val is None:
+        return None
+    s = str(val).strip()
+    if not s:
+        return None
+    try:
+        return int(s)
+    except Exception:
+        try:
+            return int(float(s))
+        except Exception:
+            return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, Any]) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """Returns (limit, window_s, remaining, reset_s) from RateLimit-* headers."""
+    hdr = {str(k).lower(): v for k, v in (headers or {}).items()}
+
+    raw_limit = hdr.get("ratelimit-limit") or hdr.get("x-ratelimit-limit")
+    limit: Optional[int] = None
+    window_s: Optional[int] = None
+    if raw_limit:
+        parts = [p.strip() for p in str(raw_limit).split(";") if p.strip()]
+        if parts:
+            limit = _to_int(parts[0])
+        for p in parts[1:]:
+            if p.startswith("w="):
+                window_s = _to_int(p.split("=", 1)[1])
+
+    remaining = _to_int(hdr.get("ratelimit-remaining") or hdr.get("x-ratelimit-remaining"))
+    reset_s = _to_int(hdr.get("ratelimit-reset") or hdr.get("x-ratelimit-reset"))
+    return limit, window_s, remaining, reset_s
+
+
+class RateGovernor:
+    """
+    Token bucket shared by all processes using the same XIQ account.
+
+    account:  account name (usually the API username); XIQ_GOVERNOR_ACCOUNT
+              overrides it so tools with different login sources can share
+              one bucket.
+    reserve:  fraction of the limit that is never spent (interactive use).
+    max_wait: upper bound for a single acquire(); afterwards the request is
+              sent anyway and the API decides.
+    """
+
+    _thread_lock = threading.Lock()
+
+    def __init__(self, account: Optional[str] = None, reserve: float = 0.02,
+                 max_wait: float = 300.0) -> None:
+        account = os.environ.get("XIQ_GOVERNOR_ACCOUNT") or account or "default"
+        key = hashlib.sha1(account.strip().lower().encode("utf-8")).hexdigest()[:12]
+        base = os.path.join(_state_dir(), f"ratelimit_{key}")
+        self.state_file = base + ".json"
+        self.lock_file = base + ".lock"
+        self.reserve = max(0.0, reserve)
+        self.max_wait = max(0.0, max_wait)
+
+    # -----------------------------------------------------------------
+    # State handling
+    # -----------------------------------------------------------------
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+        return {}
+
+    def _save(self, state: Dict[str, Any]) -> None:
+        tmp = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_file)
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, Any]]:
+        """Exclusive access (threads + processes) to the bucket state."""
+        with self._thread_lock:
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o660)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                state = self._load()
+                yield state
+                self._save(state)
+            finally:
+                os.close(fd)  # releases the flock
+
+    @staticmethod
+    def _refill(state: Dict[str, Any], now: float) -> None:
+        limit = state.get("limit")
+        tokens = state.get("tokens")
+        if tokens is None:
+            return
+        if not limit:
+            # no RateLimit headers seen (e.g. a bare 429): nothing to refill the
+            # bucket with, so drop it once the block / reset is over
+            if now >= float(state.get("blocked_until") or 0) and now >= float(state.get("reset_at") or 0):
+                state["tokens"] = None
+                state["reset_at"] = None
+            return
+
+        reset_at = state.get("reset_at")
+        if reset_at and now >= reset_at:
+            # server window rolled over
+            state["tokens"] = float(limit)
+            state["reset_at"] = None
+        else:
+            window_s = state.get("window_s") or 0
+            if window_s > 0:
+                rate = float(limit) / float(window_s)
+                elapsed = max(0.0, now - float(state.get("ts") or now))
+                state["tokens"] = min(float(limit), float(tokens) + elapsed * rate)
+        state["ts"] = now
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+    def acquire(self) -> float:
+        """Take one token, waiting if the shared budget is spent. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._locked() as state:
+                now = time.time()
+                self._refill(state, now)
+
+                wait = 0.0
+                blocked_until = float(state.get("blocked_until") or 0)
+                tokens = state.get("tokens")
+                limit = state.get("limit") or 0
+                floor = 1.0 + limit * self.reserve
+
+                if blocked_until > now:
+                    wait = blocked_until - now
+                elif tokens is not None and tokens < floor:
+                    window_s = state.get("window_s") or 0
+                    if limit and window_s:
+                        wait = (floor - tokens) * float(window_s) / float(limit)
+                    elif state.get("reset_at"):
+                        wait = max(0.0, float(state["reset_at"]) - now)
+                    else:
+                        wait = DEFAULT_BACKOFF_S
+                elif tokens is not None:
+                    state["tokens"] = tokens - 1.0
+
+                if wait <= 0:
+                    return waited
+
+            if waited >= self.max_wait:
+                return waited
+            step = min(wait, self.max_wait - waited, 5.0)
+            time.sleep(step)
+            waited += step
+
+    def feed(self, headers: Mapping[str, Any], status_code: Optional[int] = None) -> None:
+        """Update the shared bucket from the RateLimit headers of a response."""
+        limit, window_s, remaining, reset_s = parse_rate_limit_headers(headers)
+        retry_after = _to_int({str(k).lower(): v for k, v in (headers or {}).items()}.get("retry-after"))
+        if status_code != 429 and all(v is None for v in (limit, window_s, remaining, reset_s)):
+            return
+
+        with self._locked() as state:
+            now = time.time()
+            self._refill(state, now)
+
+            if limit:
+                state["limit"] = limit
+            if window_s:
+                state["window_s"] = window_s
+
+            new_reset = now + reset_s if reset_s is not None else None
+            if remaining is not None:
+                old_reset = state.get("reset_at")
+                same_window = (old_reset is not None and new_reset is not None
+                               and abs(float(old_reset) - new_reset) < 5.0)
+                if same_window and state.get("tokens") is not None:
+                    # responses of parallel requests may arrive out of order
+                    state["tokens"] = min(float(state["tokens"]), float(remaining))
+                else:
+                    state["tokens"] = float(remaining)
+                state["ts"] = now
+            if new_reset is not None:
+                state["reset_at"] = new_reset
+
+            if status_code == 429:
+                pause = retry_after or reset_s or DEFAULT_BACKOFF_S
+                state["blocked_until"] = max(float(state.get("blocked_until") or 0), now + pause)
+                state["tokens"] = 0.0
+                state["ts"] = now
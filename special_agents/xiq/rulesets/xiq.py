@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from cmk.rulesets.v1 import Title, Help
+from collections.abc import Mapping
+
+from cmk.rulesets.v1 import Title, Help, Message
 from cmk.rulesets.v1.form_specs import (
     DefaultValue,
     DictElement,
@@ -9,9 +11,21 @@ from cmk.rulesets.v1.form_specs import (
     String,
     BooleanChoice,
     Integer,
+    SingleChoice,
+    SingleChoiceElement,
+    validators,
 )
 from cmk.rulesets.v1.rule_specs import SpecialAgent, Topic
 
+
+def _validate_sharding(value: Mapping[str, object]) -> None:
+    shard, shards = value.get("shard"), value.get("shards")
+    if isinstance(shard, int) and isinstance(shards, int) and shard > shards:
+        raise validators.ValidationError(
+            Message("Shard %s liegt ausserhalb von 1..%s") % (str(shard), str(shards))
+        )
+
+
 def _parameter_form_xiq():
     return Dictionary(
         title=Title("ExtremeCloud IQ – API Integration"),
@@ -54,6 +68,213 @@ def _parameter_form_xiq():
                     title=Title("Proxy Server (optional)"),
                 ),
             ),
+            "radio_batch_size": DictElement(
+                parameter_form=Integer(
+                    title=Title("Radio-Informationen: APs pro Bulk-Request"),
+                    help_text=Help(
+                        "Anzahl der APs, deren Radio-Informationen gemeinsam in einem "
+                        "Request abgefragt werden. 0 = ein Request pro AP."
+                    ),
+                    prefill=DefaultValue(100),
+                ),
+            ),
+            "workers": DictElement(
+                parameter_form=Integer(
+                    title=Title("Parallele API-Requests (Worker)"),
+                    help_text=Help(
+                        "Anzahl paralleler Worker fuer AP-bezogene API-Requests. "
+                        "1 = sequentiell."
+                    ),
+                    prefill=DefaultValue(8),
+                ),
+            ),
+            "page_workers": DictElement(
+                parameter_form=Integer(
+                    title=Title("Parallele Seitenabrufe (/devices)"),
+                    help_text=Help(
+                        "Anzahl gleichzeitig abgerufener Seiten der Geraeteliste. "
+                        "Das Rate-Limit wird dabei weiterhin eingehalten. "
+                        "1 = Seiten nacheinander abrufen."
+                    ),
+                    prefill=DefaultValue(4),
+                ),
+            ),
+            "device_view": DictElement(
+                parameter_form=SingleChoice(
+                    title=Title("Geraeteabfrage (/devices)"),
+                    help_text=Help(
+                        "Nur die benoetigten Felder abfragen (kleinere Antworten, "
+                        "automatischer Rueckfall auf FULL) oder immer die FULL-Ansicht."
+                    ),
+                    elements=[
+                        SingleChoiceElement(name="projected", title=Title("Nur benoetigte Felder")),
+                        SingleChoiceElement(name="full", title=Title("FULL")),
+                    ],
+                    prefill=DefaultValue("projected"),
+                ),
+            ),
+            "radio_payload": DictElement(
+                parameter_form=SingleChoice(
+                    title=Title("Radio-Informationen in der Agent-Ausgabe"),
+                    help_text=Help(
+                        "Nur die vom Check ausgewerteten Felder (Name, MAC, Frequenz, Kanal, "
+                        "Kanalbreite, Modus, Leistung, WLANs, Client-Zahl) oder die "
+                        "vollstaendigen API-Daten inkl. Client-Listen (Fehlersuche)."
+                    ),
+                    elements=[
+                        SingleChoiceElement(name="trimmed", title=Title("Nur benoetigte Felder")),
+                        SingleChoiceElement(name="raw", title=Title("Rohdaten der API")),
+                    ],
+                    prefill=DefaultValue("trimmed"),
+                ),
+            ),
+            "client_counts": DictElement(
+                parameter_form=SingleChoice(
+                    title=Title("Clients je SSID und Band"),
+                    help_text=Help(
+                        "Aus den Client-Listen der Radio-Informationen je AP oder aus einer "
+                        "einzigen, seitenweisen Abfrage von /clients/active fuer alle APs "
+                        "(deckt auch APs aus dem Radio-Cache ab). Schlaegt /clients/active "
+                        "fehl, werden die Client-Listen der Radios verwendet."
+                    ),
+                    elements=[
+                        SingleChoiceElement(name="radios", title=Title("Client-Listen der Radios")),
+                        SingleChoiceElement(name="clients_active", title=Title("/clients/active (Bulk)")),
+                    ],
+                    prefill=DefaultValue("radios"),
+                ),
+            ),
+            "h1_neighbors": DictElement(
+                parameter_form=SingleChoice(
+                    title=Title("H1 Nachbartabelle"),
+                    help_text=Help(
+                        "Die LLDP/CDP-Nachbarn der APs stehen bereits im Piggyback der APs. "
+                        "Auf dem Haupthost alle Zeilen ausgeben, je AP nur eine Referenzzeile "
+                        "(Anzahl und erster Nachbar) oder nur die Nachbarn der Nicht-AP-Geraete."
+                    ),
+                    elements=[
+                        SingleChoiceElement(name="all", title=Title("Alle Zeilen")),
+                        SingleChoiceElement(name="reference", title=Title("APs als Referenz")),
+                        SingleChoiceElement(name="non_ap", title=Title("Nur Nicht-AP-Geraete")),
+                    ],
+                    prefill=DefaultValue("all"),
+                ),
+            ),
+            "inventory_resync": DictElement(
+                parameter_form=Integer(
+                    title=Title("Inventar nur bei Aenderung (Resync-Intervall in Sekunden)"),
+                    help_text=Help(
+                        "Der Agent merkt sich je Geraet einen Hash der Inventardaten und gibt "
+                        "die Inventartabelle nur aus, wenn sich ein Geraet geaendert hat oder "
+                        "das Resync-Intervall abgelaufen ist; sonst nur eine Markierung "
+                        "(Checkmk verwendet die zuletzt gelieferte Tabelle weiter)."
+                    ),
+                    prefill=DefaultValue(21600),
+                ),
+            ),
+            "radio_cache_ttl": DictElement(
+                parameter_form=Integer(
+                    title=Title("Radio-Konfiguration cachen (Sekunden)"),
+                    help_text=Help(
+                        "Kanal, Kanalbreite, Modus, Sendeleistung und WLAN/BSSID-Listen je AP "
+                        "werden so lange aus dem lokalen Cache verwendet; bei Aenderung von "
+                        "Firmware, Modell, Network Policy oder nach einem Reboot wird sofort neu "
+                        "abgefragt. Client-Zahlen kommen immer aktuell aus /devices, die "
+                        "Client-Verteilung je SSID aus /clients/active. Ohne diese Option "
+                        "ist der Cache aus (Agent-Default 0); beim Aktivieren werden 3600 s "
+                        "vorgeschlagen, 0 = aus."
+                    ),
+                    prefill=DefaultValue(3600),
+                ),
+            ),
+            "radio_cache_refresh": DictElement(
+                parameter_form=Integer(
+                    title=Title("Radio-Cache: veraltete APs pro Lauf aktualisieren"),
+                    help_text=Help(
+                        "Veraltete Eintraege (aelter als die Cache-Zeit) werden weiter "
+                        "ausgeliefert und pro Lauf hoechstens in dieser Anzahl neu abgefragt. "
+                        "Nach der doppelten Cache-Zeit wird immer neu abgefragt."
+                    ),
+                    prefill=DefaultValue(100),
+                ),
+            ),
+            "redis_url": DictElement(
+                parameter_form=String(
+                    title=Title("AP-Daten nach Redis schreiben (URL)"),
+                    help_text=Help(
+                        "Nach jedem Lauf werden die AP-Daten (Hostname, IP, Seriennummer, MAC, "
+                        "Standorte, SSIDs) als Hashes ap:<id> im Format von eciq_ap_to_redis.py "
+                        "geschrieben, nur geaenderte APs, ohne zusaetzliche API-Abfragen. "
+                        "Beispiel: redis://localhost:6379/3. Benoetigt das Python-Modul redis."
+                    ),
+                ),
+            ),
+            "collection": DictElement(
+                parameter_form=SingleChoice(
+                    title=Title("Datenquelle"),
+                    help_text=Help(
+                        "Direkt: jeder Agent-Lauf fragt die API ab. "
+                        "Collector-Snapshot: ein separat laufender Collector "
+                        "('agent_xiq --collector --interval 120 ...', gleiche Parameter und Host) "
+                        "schreibt die Daten in einen Snapshot; der Agent gibt nur diesen aus. "
+                        "Das Alter des Snapshots zeigt der Service 'XIQ Collector Snapshot'."
+                    ),
+                    elements=[
+                        SingleChoiceElement(name="direct", title=Title("Direkt von der API")),
+                        SingleChoiceElement(name="from_cache", title=Title("Collector-Snapshot")),
+                    ],
+                    prefill=DefaultValue("direct"),
+                ),
+            ),
+            "sharding": DictElement(
+                parameter_form=Dictionary(
+                    title=Title("Sharding (Flotte auf mehrere Hosts verteilen)"),
+                    help_text=Help(
+                        "Dieser Host sammelt nur den Anteil 'Shard' von 'Anzahl Shards'. "
+                        "Alle Shard-Hosts verwenden dieselbe Anzahl und Aufteilung; "
+                        "die Teilsummen werden per Piggyback an den Summary-Host gesendet "
+                        "und dort vom Check 'XIQ Summary Combined' addiert. "
+                        "Achtung: Die API kann nicht nach Shard filtern, jeder Shard-Host liest "
+                        "die komplette Liste /devices (und ggf. /clients/active) und verwirft "
+                        "fremde Geraete erst danach. N Shards verbrauchen daher das N-fache "
+                        "API-Kontingent; verteilt werden nur Radio-Abfragen, Ausgabe und Verarbeitung."
+                    ),
+                    custom_validate=(_validate_sharding,),
+                    elements={
+                        "shard": DictElement(
+                            parameter_form=Integer(
+                                title=Title("Shard (1..Anzahl)"),
+                                prefill=DefaultValue(1),
+                                custom_validate=(validators.NumberInRange(min_value=1),),
+                            ),
+                            required=True,
+                        ),
+                        "shards": DictElement(
+                            parameter_form=Integer(
+                                title=Title("Anzahl Shards"),
+                                prefill=DefaultValue(2),
+                                custom_validate=(validators.NumberInRange(min_value=1),),
+                            ),
+                            required=True,
+                        ),
+                        "shard_by": DictElement(
+                            parameter_form=SingleChoice(
+                                title=Title("Aufteilung nach"),
+                                elements=[
+                                    SingleChoiceElement(name="location", title=Title("LOC-Code (Standort bleibt zusammen)")),
+                                    SingleChoiceElement(name="device", title=Title("Geraete-ID")),
+                                ],
+                                prefill=DefaultValue("location"),
+                            ),
+                        ),
+                        "summary_host": DictElement(
+                            parameter_form=String(
+                                title=Title("Summary-Host (Standard: dieser Host)"),
+                            ),
+                        ),
+                    },
+                ),
+            ),
         },
     )
 
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from typing import Iterator
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from cmk.server_side_calls.v1 import (
     SpecialAgentConfig,
     SpecialAgentCommand,
@@ -8,6 +8,19 @@ from cmk.server_side_calls.v1 import (
     Secret,
 )
 
+class XIQSharding(BaseModel):
+    shard: int
+    shards: int
+    shard_by: str = "location"
+    summary_host: str | None = None
+
+    @model_validator(mode="after")
+    def _shard_in_range(self) -> "XIQSharding":
+        # agent_xiq would fail on --shard i/n, reject the rule right here
+        if not 1 <= self.shard <= self.shards:
+            raise ValueError(f"shard {self.shard}/{self.shards} out of range")
+        return self
+
 class XIQParams(BaseModel):
     url: str = Field(default="https://api.extremecloudiq.com")
     username: str
@@ -15,6 +28,23 @@ class XIQParams(BaseModel):
     verify_tls: bool = True
     timeout: int = 30
     proxy_url: str | None = None
+    radio_batch_size: int = 100
+    workers: int = 8
+    page_workers: int = 4
+    device_view: str = "projected"
+    radio_payload: str = "trimmed"
+    client_counts: str = "radios"
+    h1_neighbors: str = "all"
+    inventory_resync: int | None = None
+    radio_cache_ttl: int = 0        # option not set = cache off, as the agent default
+    radio_cache_refresh: int = 100
+    collection: str = "direct"
+    redis_url: str | None = None
+    sharding: XIQSharding | None = None
+
+# Ruleset choice names must be identifiers, the agent options use dashes
+_CLIENT_COUNTS = {"radios": "radios", "clients_active": "clients-active"}
+_H1_NEIGHBORS = {"all": "all", "reference": "reference", "non_ap": "non-ap"}
 
 def _commands(params: XIQParams, host_config: HostConfig) -> Iterator[SpecialAgentCommand]:
     args: list[str] = [
@@ -24,11 +54,33 @@ def _commands(params: XIQParams, host_config: HostConfig) -> Iterator[SpecialAge
         "--password", params.password.unsafe(), 
         "--timeout", str(params.timeout),
         "--host", host_config.name,
+        "--radio-batch-size", str(params.radio_batch_size),
+        "--workers", str(params.workers),
+        "--page-workers", str(params.page_workers),
+        "--device-view", params.device_view,
+        "--radio-payload", params.radio_payload,
+        "--client-counts", _CLIENT_COUNTS.get(params.client_counts, "radios"),
+        "--h1-neighbors", _H1_NEIGHBORS.get(params.h1_neighbors, "all"),
+        "--radio-cache-ttl", str(params.radio_cache_ttl),
+        "--radio-cache-refresh", str(params.radio_cache_refresh),
     ]
     if not params.verify_tls:
         args.append("--no-cert-check")
     if params.proxy_url:
         args += ["--proxy", params.proxy_url]
+    if params.inventory_resync:
+        args += ["--inventory-delta", "--inventory-resync", str(params.inventory_resync)]
+    if params.redis_url:
+        args += ["--redis-url", params.redis_url]
+    if params.collection == "from_cache":
+        args.append("--from-cache")
+    if params.sharding:
+        args += [
+            "--shard", f"{params.sharding.shard}/{params.sharding.shards}",
+            "--shard-by", params.sharding.shard_by,
+        ]
+        if params.sharding.summary_host:
+            args += ["--summary-host", params.sharding.summary_host]
     yield SpecialAgentCommand(command_arguments=args)
 
 special_agent_xiq = SpecialAgentConfig(
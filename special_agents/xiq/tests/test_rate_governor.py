@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""lib/rate_governor.py: shared token bucket, 429 handling."""
+
+import os
+import sys
+
+import pytest
+
+try:
+    from cmk_addons.plugins.xiq.lib import rate_governor
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "lib"))
+    import rate_governor  # type: ignore[no-redef]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    monkeypatch.setenv("XIQ_GOVERNOR_DIR", str(tmp_path))
+    monkeypatch.delenv("XIQ_GOVERNOR_ACCOUNT", raising=False)
+    c = _Clock()
+    monkeypatch.setattr(rate_governor.time, "time", c.time)
+    monkeypatch.setattr(rate_governor.time, "sleep", c.sleep)
+    return c
+
+
+def test_headerless_429_blocks_only_until_backoff(clock):
+    gov = rate_governor.RateGovernor("user", max_wait=300)
+    gov.feed({}, 429)
+
+    assert gov.acquire() == pytest.approx(rate_governor.DEFAULT_BACKOFF_S)
+    # bucket without a known limit is dropped, later requests do not wait
+    assert gov.acquire() == 0.0
+    assert rate_governor.RateGovernor("user", max_wait=300).acquire() == 0.0
+
+
+def test_headerless_429_honours_retry_after(clock):
+    gov = rate_governor.RateGovernor("user", max_wait=300)
+    gov.feed({"Retry-After": "12"}, 429)
+
+    assert gov.acquire() == pytest.approx(12.0)
+    gov.feed({}, 200)
+    assert gov.acquire() == 0.0
+
+
+def test_limit_headers_refill_after_429(clock):
+    gov = rate_governor.RateGovernor("user", reserve=0.0, max_wait=300)
+    gov.feed({"RateLimit-Limit": "100;w=60", "RateLimit-Remaining": "0", "RateLimit-Reset": "30"}, 429)
+
+    waited = gov.acquire()
+    assert 0 < waited <= 30.0
+    assert gov.acquire() == 0.0
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+xiq_ssid_clients discovery: every SSID configured on the radios (WLANs) is
+discovered, whether or not it has clients right now, plus SSIDs that only
+show up in the agent's _ssid_freq.
+
+Run as site user: OMD[site]:~$ python3 -m pytest local/lib/python3/cmk_addons/plugins/xiq/tests
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("cmk.agent_based.v2")
+
+from cmk_addons.plugins.xiq.agent_based.check_ssid_clients import discover_xiq_ssids  # noqa: E402
+from cmk_addons.plugins.xiq.agent_based.sections import parse_xiq_radio_information  # noqa: E402
+
+
+def _radio(name, frequency, clients, *ssids):
+    return {
+        "name": name,
+        "frequency": frequency,
+        "active_clients": clients,
+        "wlans": [{"ssid": s, "bssid": f"00:11:22:33:44:{i:02x}"} for i, s in enumerate(ssids)],
+    }
+
+
+def _wlan_ssids(payload):
+    """Expected items from the raw payload, without the agent-supplied _ssid_freq."""
+    return {
+        str(w.get("ssid") or "").strip()
+        for r in payload.get("radios") or []
+        for w in r.get("wlans") or []
+    } - {""}
+
+
+def _discover(payload):
+    section = parse_xiq_radio_information([[json.dumps(dict(payload, device_id=1, hostname="AP1"))]])
+    return [s.item for s in discover_xiq_ssids(section, None, None)]
+
+
+SECTIONS = {
+    "wlans_only": {
+        "radios": [_radio("wifi0", "2.4GHz", 3, "Corp", "Guest"), _radio("wifi1", "5GHz", 0, " Corp ")],
+    },
+    "clients_on_one_ssid": {
+        "radios": [_radio("wifi0", "2.4GHz", 3, "Corp", "Guest"), _radio("wifi1", "5GHz", 2, "IoT")],
+        "_ssid_freq": {"Corp": {"2.4GHz": 3, "5GHz": 0, "6GHz": 0}},
+    },
+    "ssid_freq_without_radios": {
+        "radios": [],
+        "_ssid_freq": {"Corp": {"5GHz": 1}, "Lab": {"6GHz": 2}},
+    },
+    "empty_ssid_freq": {
+        "radios": [_radio("wifi0", "", 1, "Corp", "")],
+        "_ssid_freq": {},
+    },
+    "no_radios": {"radios": []},
+}
+
+
+@pytest.mark.parametrize("name", sorted(SECTIONS))
+def test_discovery_covers_configured_and_active_ssids(name):
+    payload = SECTIONS[name]
+    expected = _wlan_ssids(payload) | set(payload.get("_ssid_freq") or {})
+    assert _discover(payload) == sorted(expected)
+
+
+def test_discovery_does_not_depend_on_current_clients():
+    payload = SECTIONS["clients_on_one_ssid"]
+    without_clients = {"radios": payload["radios"]}
+    assert _discover(payload) == _discover(without_clients) == ["Corp", "Guest", "IoT"]
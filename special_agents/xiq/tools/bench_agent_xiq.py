@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scale benchmark for agent_xiq against the local XIQ stub (xiq_stub_server.py).
+
+For every fleet size the agent runs once against a fresh stub and reports
+  wall time, API requests (per endpoint), peak RSS and output bytes.
+The agent output is then parsed with the section parsers of
+agent_based/sections.py in a separate process (wall time, peak RSS).
+Parsing needs cmk.agent_based (run it as site user); otherwise it is skipped.
+
+Usage:
+  ./bench_agent_xiq.py                          # 100, 1000, 10000 devices
+  ./bench_agent_xiq.py --sizes 10000 --latency-ms 50 -- --workers 16
+  ./bench_agent_xiq.py --json > baseline.json   # machine readable
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from xiq_stub_server import start_server
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_AGENT = os.path.join(HERE, os.pardir, "libexec", "agent_xiq")
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+def _run_measured(cmd: List[str], stdout_path: str, env: Dict[str, str]) -> Tuple[int, float, float]:
+    """Runs cmd with stdout to a file; returns (exit code, wall seconds, peak RSS in MB)."""
+    start = time.perf_counter()
+    with open(stdout_path, "wb") as out:
+        proc = subprocess.Popen(cmd, stdout=out, stderr=subprocess.PIPE, env=env)
+        _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0 and proc.stderr is not None:
+        sys.stderr.write(proc.stderr.read().decode("utf-8", "replace"))
+    # ru_maxrss is in KiB on Linux
+    return proc.returncode, wall, usage.ru_maxrss / 1024.0
+
+
+def split_sections(text: str) -> Dict[str, List[List[str]]]:
+    """Agent output -> {section name: string table}, tables of all (piggyback) hosts concatenated per
+    section, split like Checkmk does (sep(n) or whitespace)."""
+    tables: Dict[str, List[List[str]]] = {}
+    current: Optional[List[List[str]]] = None
+    sep: Optional[str] = None
+    for line in text.splitlines():
+        if line.startswith("<<<<") and line.endswith(">>>>"):
+            current = None
+            continue
+        if line.startswith("<<<") and line.endswith(">>>"):
+            header = line[3:-3].split(":")
+            sep = None
+            for opt in header[1:]:
+                if opt.startswith("sep(") and opt.endswith(")"):
+                    sep = chr(int(opt[4:-1]))
+            current = tables.setdefault(header[0], [])
+            # one marker row per section instance, so the parser can be called per host
+            current.append([])
+            continue
+        if current is not None:
+            current.append(line.split(sep) if sep else line.split())
+    return tables
+
+
+def parse_output(path: str) -> Dict[str, Any]:
+    """Parses an agent output file with the registered section parsers (runs in a child process)."""
+    try:
+        from cmk.agent_based.v2 import AgentSection
+        from cmk_addons.plugins.xiq.agent_based import sections
+    except ImportError as e:
+        return {"skipped": f"section parsers not importable ({e})"}
+
+    parsers = {
+        obj.name: obj.parse_function
+        for obj in vars(sections).values()
+        if isinstance(obj, AgentSection)
+    }
+    with open(path, "r", encoding="utf-8") as f:
+        tables = split_sections(f.read())
+
+    start = time.perf_counter()
+    calls = 0
+    for name, rows in tables.items():
+        parse = parsers.get(name)
+        if parse is None:
+            continue
+        table: List[List[str]] = []
+        for row in rows + [[]]:
+            if row:
+                table.append(row)
+                continue
+            if table:
+                parse(table)
+                calls += 1
+            table = []
+    return {"parse_s": round(time.perf_counter() - start, 3), "parse_calls": calls}
+
+
+# ---------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------
+def bench_size(devices: int, agent: str, agent_args: List[str], latency_ms: int,
+               radio_missing_every: int, workdir: str) -> Dict[str, Any]:
+    server = start_server(devices, latency_ms=latency_ms, radio_missing_every=radio_missing_every)
+    try:
+        env = dict(os.environ)
+        env["OMD_ROOT"] = os.path.join(workdir, f"omd_{devices}")
+        env["XIQ_GOVERNOR_DIR"] = os.path.join(workdir, f"gov_{devices}")
+        out_path = os.path.join(workdir, f"agent_{devices}.out")
+        cmd = [
+            sys.executable, agent,
+            "--url", f"http://127.0.0.1:{server.server_port}",
+            "--username", "bench", "--password", "bench", "--host", "xiq-bench",
+        ] + agent_args
+
+        rc, wall, rss = _run_measured(cmd, out_path, env)
+        stats = server.snapshot()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    result: Dict[str, Any] = {
+        "devices": devices,
+        "exit_code": rc,
+        "wall_s": round(wall, 3),
+        "requests": stats["requests"],
+        "endpoints": stats["endpoints"],
+        "bytes_received": stats["bytes_sent"],
+        "peak_rss_mb": round(rss, 1),
+        "output_bytes": os.path.getsize(out_path),
+    }
+
+    parse_json = os.path.join(workdir, f"parse_{devices}.json")
+    prc, pwall, prss = _run_measured(
+        [sys.executable, os.path.abspath(__file__), "--parse-only", out_path], parse_json, dict(os.environ)
+    )
+    try:
+        with open(parse_json, "r", encoding="utf-8") as f:
+            parsed = json.load(f)
+    except Exception:
+        parsed = {"skipped": f"parser exited with {prc}"}
+    if "skipped" in parsed:
+        result["parse"] = parsed
+    else:
+        parsed.update({"wall_s": round(pwall, 3), "peak_rss_mb": round(prss, 1)})
+        result["parse"] = parsed
+    return result
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    print(f"{'devices':>8} {'wall_s':>8} {'requests':>9} {'rss_mb':>8} {'out_kb':>9} "
+          f"{'parse_s':>8} {'parse_rss':>10}")
+    for r in results:
+        p = r["parse"]
+        parse_s = f"{p['parse_s']:.3f}" if "parse_s" in p else "-"
+        parse_rss = f"{p['peak_rss_mb']:.1f}" if "peak_rss_mb" in p else "-"
+        print(f"{r['devices']:>8} {r['wall_s']:>8.3f} {r['requests']:>9} {r['peak_rss_mb']:>8.1f} "
+              f"{r['output_bytes'] / 1024:>9.1f} {parse_s:>8} {parse_rss:>10}")
+    for r in results:
+        endpoints = ", ".join(f"{k}={v}" for k, v in sorted(r["endpoints"].items()))
+        print(f"  {r['devices']}: {endpoints}" + ("" if r["exit_code"] == 0 else f" (exit {r['exit_code']})"))
+        if "skipped" in r["parse"]:
+            print(f"  {r['devices']}: parse skipped: {r['parse']['skipped']}")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="agent_xiq scale benchmark against the local XIQ stub")
+    p.add_argument("--sizes", default="100,1000,10000", help="Comma separated fleet sizes")
+    p.add_argument("--agent", default=DEFAULT_AGENT, help="Path to agent_xiq")
+    p.add_argument("--latency-ms", type=int, default=0, help="Artificial delay per stub response")
+    p.add_argument("--radio-missing-every", type=int, default=0,
+                   help="Leave every n-th AP out of bulk radio responses (0 = none)")
+    p.add_argument("--json", action="store_true", help="Print results as JSON")
+    p.add_argument("--parse-only", metavar="FILE", help=argparse.SUPPRESS)
+    p.add_argument("agent_args", nargs="*", help="Extra agent arguments (after --)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.parse_only:
+        print(json.dumps(parse_output(args.parse_only)))
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="xiq_bench_") as workdir:
+        for n in sizes:
+            results.append(bench_size(n, os.path.abspath(args.agent), args.agent_args,
+                                      args.latency_ms, args.radio_missing_every, workdir))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of the JSON backends in lib/jsoncodec.py on real-size XIQ payloads.
+
+Payloads come from the stub fleet (xiq_stub_server.py):
+  devices_page    decode one /devices FULL page (100 devices)      -> response decoding
+  radio_batch     decode one bulk radio-information batch (100 APs) -> response decoding
+  radio_section   encode the xiq_radio_information block per AP     -> agent output
+  radio_parse     decode the xiq_radio_information block per AP     -> section parsing
+
+Usage:
+  ./bench_json_codec.py                 # 1000 APs for the per-AP cases
+  ./bench_json_codec.py --aps 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from xiq_stub_server import StubFleet
+
+try:
+    from cmk_addons.plugins.xiq.lib import jsoncodec
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "lib"))
+    import jsoncodec  # type: ignore[no-redef]
+
+
+def _best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Best wall time of repeat runs, GC disabled while timing (like timeit)."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def _payloads(aps: int) -> Dict[str, Any]:
+    fleet = StubFleet(aps)
+    devices = [fleet.device(i) for i in range(min(100, aps))]
+    radio_ids = [i for i in range(aps) if i % 10][:100]
+    sections = [
+        {"device_id": fleet.device_id(i), "hostname": f"AP-{i:05d}", "radios": fleet.radios(i), "_ssid_freq": {}}
+        for i in range(aps) if i % 10
+    ]
+    return {
+        "devices_page": json.dumps({"page": 1, "count": len(devices), "data": devices}).encode("utf-8"),
+        "radio_batch": json.dumps({"data": [{"device_id": fleet.device_id(i), "radios": fleet.radios(i)}
+                                            for i in radio_ids]}).encode("utf-8"),
+        "radio_section": sections,
+        "radio_parse": [json.dumps(s, separators=(",", ":")) for s in sections],
+    }
+
+
+def run(aps: int, repeat: int) -> List[Dict[str, Any]]:
+    payloads = _payloads(aps)
+    cases = {
+        "devices_page": lambda loads, dumps: loads(payloads["devices_page"]),
+        "radio_batch": lambda loads, dumps: loads(payloads["radio_batch"]),
+        "radio_section": lambda loads, dumps: [dumps(s) for s in payloads["radio_section"]],
+        "radio_parse": lambda loads, dumps: [loads(s) for s in payloads["radio_parse"]],
+    }
+    results = []
+    for name, (loads, dumps) in jsoncodec.backends().items():
+        for case, func in cases.items():
+            results.append({
+                "backend": name,
+                "case": case,
+                "seconds": _best_of(repeat, lambda: func(loads, dumps)),
+            })
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="JSON backend micro-benchmark on XIQ payloads")
+    p.add_argument("--aps", type=int, default=1000, help="Fleet size for the per-AP cases")
+    p.add_argument("--repeat", type=int, default=5, help="Runs per case (best is reported)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    results = run(args.aps, args.repeat)
+    base = {r["case"]: r["seconds"] for r in results if r["backend"] == "json"}
+
+    print(f"selected backend: {jsoncodec.BACKEND}")
+    print(f"{'case':<14} {'backend':<8} {'ms':>10} {'speedup':>8}")
+    for r in sorted(results, key=lambda r: (r["case"], r["backend"])):
+        speedup = base[r["case"]] / r["seconds"] if r["seconds"] else 0.0
+        print(f"{r['case']:<14} {r['backend']:<8} {r['seconds'] * 1000:>10.2f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
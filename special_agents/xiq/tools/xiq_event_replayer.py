@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replays XIQ device events against the agent_xiq webhook receiver (--webhook-listen).
+
+Events come from a JSONL file (one event per line, optional "delay_s" = pause
+before sending it) or are generated for the stub fleet (xiq_stub_server.py):
+every n-th AP goes down, optionally comes back up, plus config changes.
+
+Usage:
+  ../libexec/agent_xiq --url http://127.0.0.1:8999 --username u --password p --host xiq \\
+      --collector --interval 1800 --webhook-listen 127.0.0.1:8080 &
+  ./xiq_event_replayer.py --url http://127.0.0.1:8080 --synthetic 1000 --down-every 50
+  ./xiq_event_replayer.py --url http://127.0.0.1:8080 --file events.jsonl --speed 10
+  ../libexec/agent_xiq ... --host xiq --from-cache      # patched AP status
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from xiq_stub_server import StubFleet
+
+
+def synthetic_events(devices: int, down_every: int, recover: bool,
+                     config_every: int) -> Iterator[Dict[str, Any]]:
+    """Up/down and config change events for the APs of the stub fleet."""
+    fleet = StubFleet(devices)
+    for i in range(devices):
+        if i % 10 == 0:
+            continue  # switch
+        if down_every and i % down_every == 1:
+            yield {"event_type": "DEVICE_DISCONNECTED", "device_id": fleet.device_id(i)}
+            if recover:
+                yield {"event_type": "DEVICE_CONNECTED", "device_id": fleet.device_id(i), "delay_s": 0.5}
+        if config_every and i % config_every == 2:
+            yield {"event_type": "DEVICE_CONFIG_CHANGED", "device_id": fleet.device_id(i)}
+
+
+def file_events(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield json.loads(line)
+
+
+def replay(url: str, events: Iterator[Dict[str, Any]], speed: float = 1.0,
+           batch: int = 1, secret: Optional[str] = None) -> Dict[str, Any]:
+    headers = {"Authorization": f"Bearer {secret}"} if secret else {}
+    session = requests.Session()
+    sent = accepted = requests_sent = 0
+    pending: List[Dict[str, Any]] = []
+    started = time.monotonic()
+
+    def _flush() -> None:
+        nonlocal accepted, requests_sent
+        if not pending:
+            return
+        r = session.post(url, json=pending if batch > 1 else pending[0], headers=headers, timeout=10)
+        r.raise_for_status()
+        accepted += int(r.json().get("accepted", 0))
+        requests_sent += 1
+        pending.clear()
+
+    for ev in events:
+        delay = float(ev.pop("delay_s", 0) or 0)
+        if delay and speed > 0:
+            _flush()
+            time.sleep(delay / speed)
+        pending.append(ev)
+        sent += 1
+        if len(pending) >= batch:
+            _flush()
+    _flush()
+    return {"events": sent, "accepted": accepted, "requests": requests_sent,
+            "seconds": round(time.monotonic() - started, 3)}
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Replay XIQ device events against agent_xiq --webhook-listen")
+    p.add_argument("--url", required=True, help="Receiver URL, e.g. http://127.0.0.1:8080")
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--file", help="JSONL file with one event per line")
+    src.add_argument("--synthetic", type=int, metavar="DEVICES", help="Generate events for the stub fleet")
+    p.add_argument("--down-every", type=int, default=50, help="Synthetic: every n-th AP goes down")
+    p.add_argument("--recover", action="store_true", help="Synthetic: APs come back up after 0.5 s")
+    p.add_argument("--config-every", type=int, default=0, help="Synthetic: config change every n-th AP")
+    p.add_argument("--speed", type=float, default=1.0, help="Delay divisor (0 = no delays)")
+    p.add_argument("--batch", type=int, default=1, help="Events per POST")
+    p.add_argument("--secret", default=None, help="Webhook secret of the receiver")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.file:
+        events = file_events(args.file)
+    else:
+        events = synthetic_events(args.synthetic, args.down_every, args.recover, args.config_every)
+    try:
+        result = replay(args.url, events, args.speed, max(1, args.batch), args.secret)
+    except requests.RequestException as e:
+        sys.exit(f"replay failed: {e}")
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local stub of the ExtremeCloud IQ API for load tests of agent_xiq.
+
+Serves a synthetic, deterministic fleet of N devices (every 10th device is a
+switch, the rest are XIQ-managed APs, every 7th device is disconnected):
+
+  POST /login                               -> JWT with "exp" claim
+  GET  /devices                             -> paged, views=FULL or fields=...
+  GET  /devices/radio-information           -> bulk, deviceIds=...
+  GET  /devices/<id>/radio-information      -> per device
+  GET  /clients/active                      -> paged, the clients of the radio client lists
+  GET  /_stats                              -> request counters (stub only)
+  GET  /_reset                              -> reset counters (stub only)
+
+Every response carries RateLimit-Limit / -Remaining / -Reset headers; once
+the window budget is spent the stub answers 429 with Retry-After.
+
+Usage:
+  ./xiq_stub_server.py --devices 10000 --port 8999
+  ./agent_xiq --url http://127.0.0.1:8999 --username u --password p --host xiq
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# ---------------------------------------------------------------------
+# Synthetic fleet
+# ---------------------------------------------------------------------
+class StubFleet:
+    """Deterministic device / radio payloads, generated on demand (no per-device state)."""
+
+    SITES = 40
+    SSIDS = ("corp", "guest", "iot", "voice")
+
+    def __init__(self, devices: int, radio_missing_every: int = 0) -> None:
+        self.devices = max(0, devices)
+        # every n-th AP is left out of bulk radio responses (exercises the per-AP fallback)
+        self.radio_missing_every = max(0, radio_missing_every)
+        self._clients: Optional[List[Dict[str, Any]]] = None
+        self._clients_lock = threading.Lock()
+
+    @staticmethod
+    def device_id(i: int) -> int:
+        return 917000000000 + i
+
+    def index_of(self, device_id: Any) -> Optional[int]:
+        try:
+            i = int(device_id) - 917000000000
+        except (TypeError, ValueError):
+            return None
+        return i if 0 <= i < self.devices else None
+
+    @staticmethod
+    def _mac(i: int, salt: int = 0) -> str:
+        return "4C231A%06X" % ((i * 16 + salt) & 0xFFFFFF)
+
+    def device(self, i: int) -> Dict[str, Any]:
+        is_ap = i % 10 != 0
+        site = i % self.SITES
+        c24, c5, c6 = (i % 7, i % 11, i % 3) if is_ap else (0, 0, 0)
+        return {
+            "id": self.device_id(i),
+            "create_time": "2023-05-04T08:15:00.000Z",
+            "update_time": "2025-01-12T10:20:00.000Z",
+            "org_id": 1234567,
+            "serial_number": f"2107Y-{i:08d}",
+            "service_tag": "",
+            "mac_address": self._mac(i),
+            "device_function": "AP" if is_ap else "SWITCH",
+            "product_type": "AP_4000" if is_ap else "5320_48P_8XE",
+            "hostname": f"{'AP' if is_ap else 'SW'}-LOC{site:03d}-{i:05d}",
+            "ip_address": f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            "software_version": "10.7.1.0" if is_ap else "32.6.1.2",
+            "display_version": "10.7r1" if is_ap else "32.6.1.2",
+            "device_admin_state": "MANAGED",
+            "connected": i % 7 != 0,
+            "last_connect_time": "2025-01-12T10:19:55.000Z",
+            "network_policy_name": f"NP-LOC{site:03d}",
+            "network_policy_id": 500000 + site,
+            "primary_ntp_server_address": "10.0.0.10",
+            "primary_dns_server_address": "10.0.0.53",
+            "subnet_mask": "255.255.255.0",
+            "default_gateway": "10.0.0.1",
+            "ipv6_address": "",
+            "ipv6_netmask": "",
+            "simulated": False,
+            "display_name": "",
+            "location_id": 800000 + site,
+            "locations": [
+                {"id": 700000, "name": "Global"},
+                {"id": 710000 + site // 10, "name": f"DE/Region{site // 10}/LOC{site:03d}"},
+                {"id": 800000 + site, "name": f"LOC{site:03d}"},
+                {"id": 900000 + site * 4 + i % 4, "name": f"FLOOR_{i % 4}"},
+            ],
+            "country_code": 276,
+            "description": "",
+            "config_mismatch": False,
+            "managed_by": "XIQ",
+            "thread0_eui64": "",
+            "thread0_ext_mac": "",
+            "active_clients": c24 + c5 + c6,
+            "active_clients_24": c24,
+            "active_clients_5": c5,
+            "active_clients_6": c6,
+            "system_up_time": 1736676000000 - i * 1000,
+            "lldp_cdp_infos": [
+                {
+                    "instance_id": i,
+                    "interface_name": "eth0" if is_ap else "1:49",
+                    "system_name": f"SW-LOC{site:03d}-CORE",
+                    "management_ip": f"10.{site}.0.2",
+                    "port_id": f"1:{i % 48 + 1}",
+                    "port_description": f"Port {i % 48 + 1}",
+                    "system_id": self._mac(site, 15),
+                },
+            ],
+        }
+
+    def radios(self, i: int) -> List[Dict[str, Any]]:
+        if i % 10 == 0:
+            return []
+        out = []
+        for n, (freq, channel, width, mode, clients) in enumerate((
+            ("2.4GHz", 1 + (i % 3) * 5, "20", "11ax", i % 7),
+            ("5GHz", 36 + (i % 8) * 4, "80", "11ax", i % 11),
+            ("6GHz", 5 + (i % 16) * 16, "160", "11ax", i % 3),
+        )):
+            wlans = [
+                {
+                    "ssid": ssid,
+                    "bssid": self._mac(i, n * 4 + k),
+                    "network_policy_name": f"NP-LOC{i % self.SITES:03d}",
+                    "ssid_status": "ENABLED",
+                    "ssid_security_type": "WPA3",
+                }
+                for k, ssid in enumerate(self.SSIDS[: 2 + (i + n) % 3])
+            ]
+            out.append({
+                "name": f"wifi{n}",
+                "mac_address": self._mac(i, n * 4),
+                "frequency": freq,
+                "channel_number": channel,
+                "channel_width": width,
+                "mode": mode,
+                "power": 12 + n * 3,
+                "active_clients": clients,
+                "wlans": wlans,
+                "clients": [{"ssid": wlans[c % len(wlans)]["ssid"]} for c in range(clients)],
+            })
+        return out
+
+    def active_clients(self) -> List[Dict[str, Any]]:
+        """All clients of the radio client lists as /clients/active entries (built once)."""
+        with self._clients_lock:
+            if self._clients is None:
+                clients = []
+                for i in range(self.devices):
+                    for n, r in enumerate(self.radios(i)):
+                        for k, c in enumerate(r["clients"]):
+                            clients.append({
+                                "id": len(clients) + 1,
+                                "device_id": self.device_id(i),
+                                "mac_address": self._mac(i * 64 + n * 16 + k, 7),
+                                "ssid": c["ssid"],
+                                "channel": r["channel_number"],
+                                "frequency": r["frequency"],
+                            })
+                self._clients = clients
+            return self._clients
+
+
+# ---------------------------------------------------------------------
+# Rate limit window
+# ---------------------------------------------------------------------
+class StubRateLimit:
+    def __init__(self, limit: int, window_s: int) -> None:
+        self.limit = limit
+        self.window_s = window_s
+        self._start = time.time()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> Dict[str, str]:
+        """Consumes one request; returns the headers (with Retry-After when exhausted)."""
+        with self._lock:
+            now = time.time()
+            if now - self._start >= self.window_s:
+                self._start, self._used = now, 0
+            reset = max(1, int(self._start + self.window_s - now))
+            headers = {"RateLimit-Limit": f"{self.limit};w={self.window_s}", "RateLimit-Reset": str(reset)}
+            if self._used >= self.limit:
+                headers["RateLimit-Remaining"] = "0"
+                headers["Retry-After"] = str(reset)
+                return headers
+            self._used += 1
+            headers["RateLimit-Remaining"] = str(self.limit - self._used)
+            return headers
+
+
+# ---------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, fleet: StubFleet, rate_limit: StubRateLimit,
+                 jwt_ttl: int = 86400, latency_ms: int = 0) -> None:
+        super().__init__(address, _Handler)
+        self.fleet = fleet
+        self.rate_limit = rate_limit
+        self.jwt_ttl = jwt_ttl
+        self.latency_s = latency_ms / 1000.0
+        self.stats: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self._stats_lock = threading.Lock()
+
+    def count(self, endpoint: str, nbytes: int) -> None:
+        with self._stats_lock:
+            self.stats[endpoint] = self.stats.get(endpoint, 0) + 1
+            self.bytes_sent += nbytes
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {"requests": sum(self.stats.values()), "bytes_sent": self.bytes_sent,
+                    "endpoints": dict(self.stats)}
+
+    def reset(self) -> None:
+        with self._stats_lock:
+            self.stats.clear()
+            self.bytes_sent = 0
+
+    def token(self) -> str:
+        def _b64(obj: Dict[str, Any]) -> str:
+            return base64.urlsafe_b64encode(json.dumps(obj).encode()).decode().rstrip("=")
+        claims = {"sub": "stub", "iat": int(time.time()), "exp": int(time.time()) + self.jwt_ttl}
+        return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}.stub"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(self, endpoint: str, obj: Any, code: int = 200, rate_limited: bool = True) -> None:
+        headers = self.server.rate_limit.take() if rate_limited else {}
+        if "Retry-After" in headers:
+            code, obj = 429, {"error_code": "RATE_LIMIT_EXCEEDED"}
+        body = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+        if rate_limited:
+            self.server.count(endpoint, len(body))
+
+    def _authorized(self) -> bool:
+        return self.headers.get("Authorization", "").startswith("Bearer ")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if urlparse(self.path).path == "/login":
+            return self._send("/login", {"access_token": self.server.token(), "token_type": "Bearer"})
+        self._send("other", {"error_code": "NOT_FOUND"}, 404)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        fleet = self.server.fleet
+
+        if url.path == "/_stats":
+            return self._send("", self.server.snapshot(), rate_limited=False)
+        if url.path == "/_reset":
+            self.server.reset()
+            return self._send("", {"reset": True}, rate_limited=False)
+        if not self._authorized():
+            return self._send("unauthorized", {"error_code": "UNAUTHORIZED"}, 401)
+
+        if url.path == "/devices":
+            page = max(1, int(q.get("page", 1)))
+            limit = max(1, min(100, int(q.get("limit", 10))))
+            first = (page - 1) * limit
+            data = [fleet.device(i) for i in range(first, min(fleet.devices, first + limit))]
+            if q.get("fields"):
+                keep = {f.strip().lower() for f in q["fields"].split(",")} | {"id"}
+                data = [{k: v for k, v in d.items() if k in keep} for d in data]
+            total_pages = -(-fleet.devices // limit)
+            return self._send("/devices", {
+                "page": page, "count": len(data), "total_pages": total_pages,
+                "total_count": fleet.devices, "data": data,
+            })
+
+        if url.path == "/devices/radio-information":
+            wanted = [fleet.index_of(x) for x in q.get("deviceIds", "").split(",") if x]
+            wanted = [i for i in wanted if i is not None]
+            if len(wanted) > 1 and fleet.radio_missing_every:
+                wanted = [i for i in wanted if i % fleet.radio_missing_every != 1]
+            page = max(1, int(q.get("page", 1)))
+            limit = max(1, int(q.get("limit", 100)))
+            chunk = wanted[(page - 1) * limit: page * limit]
+            return self._send("/devices/radio-information", {
+                "page": page, "count": len(chunk), "total_pages": max(1, -(-len(wanted) // limit)),
+                "total_count": len(wanted),
+                "data": [{"device_id": fleet.device_id(i), "radios": fleet.radios(i)} for i in chunk],
+            })
+
+        if url.path == "/clients/active":
+            clients = fleet.active_clients()
+            page = max(1, int(q.get("page", 1)))
+            limit = max(1, min(100, int(q.get("limit", 10))))
+            data = clients[(page - 1) * limit: page * limit]
+            return self._send("/clients/active", {
+                "page": page, "count": len(data), "total_pages": max(1, -(-len(clients) // limit)),
+                "total_count": len(clients), "data": data,
+            })
+
+        parts = url.path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "devices" and parts[2] == "radio-information":
+            i = fleet.index_of(parts[1])
+            if i is None:
+                return self._send("/devices/<id>/radio-information", {"error_code": "NOT_FOUND"}, 404)
+            return self._send("/devices/<id>/radio-information",
+                              {"data": [{"device_id": fleet.device_id(i), "radios": fleet.radios(i)}]})
+
+        self._send("other", {"error_code": "NOT_FOUND"}, 404)
+
+
+def start_server(devices: int, host: str = "127.0.0.1", port: int = 0,
+                 rate_limit: int = 7500, window_s: int = 3600, jwt_ttl: int = 86400,
+                 latency_ms: int = 0, radio_missing_every: int = 0) -> StubServer:
+    """Starts the stub in a background thread; port 0 picks a free port (server.server_port)."""
+    server = StubServer((host, port), StubFleet(devices, radio_missing_every),
+                        StubRateLimit(rate_limit, window_s), jwt_ttl, latency_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Local ExtremeCloud IQ API stub for agent_xiq load tests")
+    p.add_argument("--devices", type=int, default=1000, help="Fleet size")
+    p.add_argument("--host", default="127.0.0.1", help="Listen address")
+    p.add_argument("--port", type=int, default=8999, help="Listen port")
+    p.add_argument("--rate-limit", type=int, default=7500, help="Requests per window")
+    p.add_argument("--window", type=int, default=3600, help="Rate limit window in seconds")
+    p.add_argument("--jwt-ttl", type=int, default=86400, help="Token lifetime in seconds")
+    p.add_argument("--latency-ms", type=int, default=0, help="Artificial delay per response")
+    p.add_argument("--radio-missing-every", type=int, default=0,
+                   help="Leave every n-th AP out of bulk radio responses (0 = none)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    server = StubServer((args.host, args.port), StubFleet(args.devices, args.radio_missing_every),
+                        StubRateLimit(args.rate_limit, args.window), args.jwt_ttl, args.latency_ms)
+    print(f"XIQ stub: {args.devices} devices on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()